@@ -9,11 +9,15 @@ import sys
 import json
 import subprocess
 import threading
+import queue
 import concurrent.futures
 import re
-import configparser
 import shutil
 import hashlib
+from collections import OrderedDict, deque
+from functools import lru_cache
+from operator import attrgetter
+from stat import S_ISDIR
 import urllib.request
 import urllib.error
 from pathlib import Path
@@ -33,6 +37,35 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import List, Dict, Any
 
+# Windows API access (ctypes) and SHOpenWithDialog structures
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+    
+    class OPENASINFO(ctypes.Structure):
+        _fields_ = [
+            ("pcszFile", wintypes.LPCWSTR),
+            ("pcszClass", wintypes.LPCWSTR),
+            ("oaifInFlags", ctypes.c_int),
+        ]
+    
+    OAIF_ALLOW_REGISTRATION = 0x1
+    OAIF_REGISTER_EXT = 0x2
+    OAIF_EXEC = 0x4
+    HRESULT_ERROR_CANCELLED = -2147023673  # HRESULT_FROM_WIN32(ERROR_CANCELLED)
+    
+    class GUID(ctypes.Structure):
+        _fields_ = [
+            ("Data1", wintypes.DWORD),
+            ("Data2", wintypes.WORD),
+            ("Data3", wintypes.WORD),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+    
+    # {B97D20BB-F46A-4C97-BA10-5E3608430854}
+    FOLDERID_Startup = GUID(0xB97D20BB, 0xF46A, 0x4C97,
+                            (ctypes.c_ubyte * 8)(0xBA, 0x10, 0x5E, 0x36, 0x08, 0x43, 0x08, 0x54))
+
 def get_config_dir():
     """Get application config directory in %APPDATA%"""
     if sys.platform == 'win32':
@@ -52,11 +85,59 @@ CONFIG_DIR = get_config_dir()
 CONFIG_FILE = os.path.join(CONFIG_DIR, "app_config.json")
 LANG_DIR = "languages"
 
+# Settings saved by save_settings, in snapshot order
+CONFIG_KEYS = (
+    "name_filter", "ext_filter", "path_filter", "exclude_path_filter", "search_dir",
+    "recursive", "use_regex", "dark_mode", "language", "use_index"
+)
+
+FILE_ITEM_CACHE_TTL = 5.0  # Seconds a stat result is reused for repeated lookups
+FILE_ITEM_CACHE_SIZE = 64
+MAX_CONCURRENT_LAUNCHES = 4  # Files launched at once by "Execute Selected"
+MAX_FLUSH_ROWS = 2000  # Rows added to the results tree per UI flush
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')  # Indexed by bit_length() // 10
+
+# Tcl lambda that inserts a flat (text, values, tag, ...) list into a Treeview and returns the new ids
+TREE_BULK_INSERT = (
+    '{tree rows} {'
+    ' set ids {};'
+    ' foreach {text values tag} $rows {lappend ids [$tree insert {} end -text $text -values $values -tags $tag]};'
+    ' return $ids'
+    '}'
+)
+
+# Regex extension filter that is just a literal suffix, e.g. \.exe$
+REGEX_EXT_SUFFIX = re.compile(r'\\\.(\w+)\$')
+
+# Flat language-file syntax read by parse_ui_section
+INI_SECTION = re.compile(r'\[([^\]]+)\]')
+INI_OPTION = re.compile(r'([^=:\s][^=:]*?)\s*[=:]\s*(.*)')
+
+# Row writes used when indexing a folder: plain insert for a fresh index,
+# upsert that only touches rows whose size or mtime changed for an update
+INSERT_FILE_SQL = 'INSERT INTO files (path, name, extension, size, mtime, is_dir) VALUES (?, ?, ?, ?, ?, ?)'
+UPSERT_FILE_SQL = (
+    INSERT_FILE_SQL + ' ON CONFLICT(path) DO UPDATE SET size = excluded.size, mtime = excluded.mtime,'
+    ' is_dir = excluded.is_dir WHERE files.mtime IS NOT excluded.mtime OR files.size IS NOT excluded.size'
+)
+
+# Context menu label templates (icon, translated label, checked file count, "files")
+MENU_LABEL_TEMPLATE = "%s %s"
+MENU_COUNT_LABEL_TEMPLATE = "%s %s (%%d %s)"
+
 # Update configuration
 GITHUB_REPO = "gloriouslegacy/ezSLauncher"
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 CURRENT_VERSION = "0.0.0"  # Will be updated by version_info.txt during build
 
+# Shared opener for update checks and downloads (handler chain and headers built once)
+URL_OPENER = urllib.request.build_opener()
+URL_OPENER.addheaders = [('User-Agent', 'ezSLauncher')]
+
+# SHA256 checksums listed in the release notes
+SHA_PORTABLE_PATTERN = re.compile(r'\*\*Portable Version.*?```\s*([a-fA-F0-9]{64})\s*```', re.DOTALL)
+SHA_INSTALLER_PATTERN = re.compile(r'\*\*Installer Version.*?```\s*([a-fA-F0-9]{64})\s*```', re.DOTALL)
+
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller
@@ -68,43 +149,122 @@ def resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+def get_extension(name: str) -> str:
+    """Same as os.path.splitext(name)[1] for a bare file name, without the path parsing"""
+    i = name.rfind('.')
+    return name[i:] if i > 0 and name[:i].lstrip('.') else ''
+
+
+def parse_ui_section(text: str):
+    """Read the [UI] section of a flat key = value language file.
+    Returns None when the file needs configparser (continuation lines, unknown syntax).
+    """
+    ui = None
+    section = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+        if line[0].isspace():
+            return None
+        m = INI_SECTION.fullmatch(stripped)
+        if m:
+            section = m.group(1)
+            if section == 'UI' and ui is None:
+                ui = {}
+            continue
+        m = INI_OPTION.fullmatch(stripped)
+        if m is None or section is None:
+            return None
+        if section == 'UI':
+            # Interned like the literal keys passed to t()
+            ui[sys.intern(m.group(1).lower())] = m.group(2)
+    return ui
+
+
 class FileItem:
     """Represents a file item in the search results"""
+    # Fixed attribute set: searches can create millions of these
+    __slots__ = ('path', 'name', 'is_dir', 'size', 'mtime', 'extension', '_size_str', '_type_str', '_modified')
+    
     def __init__(self, path: str, size: int = None, mtime: float = None):
         self.path = path
-        self.name = os.path.basename(path)
+        sep = path.rfind(os.sep)
+        if os.altsep:
+            sep = max(sep, path.rfind(os.altsep))
+        self.name = path[sep + 1:]
+        self.is_dir = None
+        self._size_str = None  # Memoized get_size_str() result
+        self._type_str = None  # Memoized get_type() result
+        
+        self._modified = None  # datetime built from mtime on first use
         
         if size is not None and mtime is not None:
             # Use provided metadata (from index)
             self.size = size
-            self.modified = datetime.fromtimestamp(mtime)
-            self.extension = os.path.splitext(path)[1]
+            self.mtime = mtime
         else:
             # Fallback to disk access
             try:
-                self.stat = os.stat(path)
-                self.size = self.stat.st_size
-                self.modified = datetime.fromtimestamp(self.stat.st_mtime)
+                stat = os.stat(path)
+                self.size = stat.st_size
+                self.mtime = stat.st_mtime
+                self.is_dir = S_ISDIR(stat.st_mode)
             except:
                 self.size = 0
-                self.modified = datetime.now()
+                self.mtime = time.time()
                 
-        self.extension = os.path.splitext(path)[1]
+        self.extension = get_extension(self.name)
+    
+    @property
+    def modified(self) -> datetime:
+        """Modification time as a datetime (converted on first access)"""
+        if self._modified is None:
+            self._modified = datetime.fromtimestamp(self.mtime)
+        return self._modified
         
     def get_size_str(self) -> str:
         """Convert file size to human readable format"""
-        size = self.size
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        if self._size_str is None:
+            size = self.size
+            # Each unit is 2**10 of the previous one, so bit_length picks it directly
+            unit = min((size.bit_length() - 1) // 10, 5) if size > 0 else 0
+            self._size_str = f"{size / (1 << (10 * unit)):.2f} {SIZE_UNITS[unit]}"
+        return self._size_str
     
     def get_type(self) -> str:
         """Get file type description"""
-        if os.path.isdir(self.path):
-            return "Folder"
-        return self.extension.upper()[1:] + " File" if self.extension else "File"
+        if self._type_str is None:
+            is_dir = self.is_dir if self.is_dir is not None else os.path.isdir(self.path)
+            if is_dir:
+                self._type_str = "Folder"
+            else:
+                self._type_str = self.extension.upper()[1:] + " File" if self.extension else "File"
+        return self._type_str
+
+
+def simplify_search_regex(pattern: str) -> str:
+    """Drop leading/trailing '.*' that cannot change a re.search() result"""
+    while pattern.startswith('.*') and pattern[2:3] not in ('*', '+', '?', '{'):
+        pattern = pattern[2:]
+    while pattern.endswith('.*') and not pattern.endswith('\\.*') and len(pattern) > 2:
+        pattern = pattern[:-2]
+    return pattern
+
+
+REGEXP_CACHE: Dict[str, re.Pattern] = {}  # Compiled patterns used by sql_regexp
+
+
+def sql_regexp(pattern: str, value: str) -> int:
+    """SQLite REGEXP function: case-insensitive re.search with cached patterns"""
+    if value is None:
+        return 0
+    compiled = REGEXP_CACHE.get(pattern)
+    if compiled is None:
+        if len(REGEXP_CACHE) >= 256:
+            REGEXP_CACHE.clear()
+        compiled = REGEXP_CACHE.setdefault(pattern, re.compile(pattern, re.IGNORECASE))
+    return 1 if compiled.search(value) else 0
 
 
 class SearchFilter:
@@ -115,6 +275,7 @@ class SearchFilter:
             path_filter = ""
 
         self.use_regex = use_regex
+        self.ext_suffixes = None  # Regex mode: lowercase suffixes when every ext pattern is a plain extension
         
         if use_regex:
             self.name_filters = []
@@ -126,7 +287,7 @@ class SearchFilter:
                 f = f.strip()
                 if f:
                     try:
-                        self.name_filters.append(re.compile(f, re.IGNORECASE))
+                        self.name_filters.append(re.compile(simplify_search_regex(f), re.IGNORECASE))
                     except re.error:
                         self.name_filters.append(re.compile(re.escape(f), re.IGNORECASE))
             
@@ -140,11 +301,16 @@ class SearchFilter:
                     except re.error:
                         self.ext_filters.append(re.compile(re.escape('.' + f) + '$', re.IGNORECASE))
             
+            # Plain extensions (\.exe$) are checked with str.endswith instead of the regex engine
+            suffixes = [REGEX_EXT_SUFFIX.fullmatch(p.pattern) for p in self.ext_filters]
+            if suffixes and all(suffixes):
+                self.ext_suffixes = tuple('.' + m.group(1).lower() for m in suffixes)
+            
             for f in path_filter.replace(',', '|').replace(';', '|').split('|') if path_filter else []:
                 f = f.strip()
                 if f:
                     try:
-                        self.path_filters.append(re.compile(f, re.IGNORECASE))
+                        self.path_filters.append(re.compile(simplify_search_regex(f), re.IGNORECASE))
                     except re.error:
                         self.path_filters.append(re.compile(re.escape(f), re.IGNORECASE))
 
@@ -152,54 +318,109 @@ class SearchFilter:
                 f = f.strip()
                 if f:
                     try:
-                        self.exclude_path_filters.append(re.compile(f, re.IGNORECASE))
+                        self.exclude_path_filters.append(re.compile(simplify_search_regex(f), re.IGNORECASE))
                     except re.error:
                         self.exclude_path_filters.append(re.compile(re.escape(f), re.IGNORECASE))
         else:
-            self.name_filters = [f.strip().lower() for f in name_filter.replace(',', ' ').replace(';', ' ').split() if f.strip()]
+            def collapse(filters, wildcard):
+                # Any-of substring terms: a wildcard matches everything, and a term containing
+                # another term can never widen the result
+                if wildcard in filters:
+                    return []
+                filters = list(dict.fromkeys(filters))
+                return [f for f in filters if not any(g != f and g in f for g in filters)]
+            
+            self.name_filters = collapse([f.strip().lower() for f in name_filter.replace(',', ' ').replace(';', ' ').split() if f.strip()], '*')
             self.ext_filters = [f.strip().lower() if f.strip().startswith('.') else '.' + f.strip().lower() 
                                for f in ext_filter.replace(',', ' ').replace(';', ' ').split() if f.strip()]
-            self.path_filters = [f.strip().lower() for f in path_filter.replace(',', ' ').replace(';', ' ').split() if f.strip()]
+            self.ext_filters = [] if '.*' in self.ext_filters else list(dict.fromkeys(self.ext_filters))
+            self.path_filters = collapse([f.strip().lower() for f in path_filter.replace(',', ' ').replace(';', ' ').split() if f.strip()], '*')
             self.exclude_path_filters = [f.strip().lower() for f in exclude_path_filter.replace(',', ' ').replace(';', ' ').split() if f.strip()]
+        
+        # Frozen so cached instances can be shared between searches
+        self.name_filters = tuple(self.name_filters)
+        self.ext_filters = tuple(self.ext_filters)
+        self.path_filters = tuple(self.path_filters)
+        self.exclude_path_filters = tuple(self.exclude_path_filters)
+        self.matches = self.build_matcher()  # matches(file_item) -> bool
     
-    def matches(self, file_item: FileItem) -> bool:
-        """Check if file matches all filters"""
+    def build_matcher(self):
+        """Build a matches() function specialised to the filters that are actually set"""
+        checks = []
+        
+        def any_search(patterns, field, negate=False):
+            # Bind pattern.search up front; a lone pattern skips the any() generator
+            searches = tuple(pattern.search for pattern in patterns)
+            get = attrgetter(field)
+            if len(patterns) > 1 and not any(pattern.groups for pattern in patterns):
+                # One alternation is a single pass in the regex engine; patterns with groups
+                # keep their own search so backreference numbers stay valid
+                try:
+                    combined = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in patterns), re.IGNORECASE)
+                    searches = (combined.search,)
+                except re.error:
+                    pass
+            if len(searches) == 1:
+                search = searches[0]
+                if negate:
+                    return lambda item: search(get(item)) is None
+                return lambda item: search(get(item)) is not None
+            if negate:
+                return lambda item: not any(search(get(item)) for search in searches)
+            return lambda item: any(search(get(item)) for search in searches)
+        
+        def any_contains(terms, field, negate=False):
+            get = attrgetter(field)
+            if len(terms) == 1:
+                term = terms[0]
+                if negate:
+                    return lambda item: term not in get(item).lower()
+                return lambda item: term in get(item).lower()
+            # Several terms: one scan with an alternation of the escaped terms
+            search = re.compile('|'.join(map(re.escape, terms))).search
+            if negate:
+                return lambda item: search(get(item).lower()) is None
+            return lambda item: search(get(item).lower()) is not None
+        
         if self.use_regex:
             # Check exclusions first
             if self.exclude_path_filters:
-                if any(pattern.search(file_item.path) for pattern in self.exclude_path_filters):
-                    return False
-
+                checks.append(any_search(self.exclude_path_filters, 'path', negate=True))
             if self.name_filters:
-                if not any(pattern.search(file_item.name) for pattern in self.name_filters):
-                    return False
-            
-            if self.ext_filters:
-                if not any(pattern.search(file_item.extension) for pattern in self.ext_filters):
-                    return False
-            
+                checks.append(any_search(self.name_filters, 'name'))
+            if self.ext_suffixes:
+                suffixes = self.ext_suffixes
+                checks.append(lambda item: item.extension.lower().endswith(suffixes))
+            elif self.ext_filters:
+                checks.append(any_search(self.ext_filters, 'extension'))
             if self.path_filters:
-                if not any(pattern.search(file_item.path) for pattern in self.path_filters):
-                    return False
+                checks.append(any_search(self.path_filters, 'path'))
         else:
             # Check exclusions first
             if self.exclude_path_filters:
-                if any(exclude_filter in file_item.path.lower() for exclude_filter in self.exclude_path_filters):
-                    return False
-
+                checks.append(any_contains(self.exclude_path_filters, 'path', negate=True))
             if self.name_filters:
-                if not any(name_filter in file_item.name.lower() for name_filter in self.name_filters):
-                    return False
-            
+                checks.append(any_contains(self.name_filters, 'name'))
             if self.ext_filters:
-                if not any(file_item.extension.lower() == ext_filter for ext_filter in self.ext_filters):
-                    return False
-            
+                extensions = frozenset(self.ext_filters)
+                checks.append(lambda item: item.extension.lower() in extensions)
             if self.path_filters:
-                if not any(path_filter in file_item.path.lower() for path_filter in self.path_filters):
-                    return False
-        
-        return True
+                checks.append(any_contains(self.path_filters, 'path'))
+        
+        if not checks:
+            return lambda item: True
+        if len(checks) == 1:
+            return checks[0]
+        if len(checks) == 2:
+            first, second = checks
+            return lambda item: first(item) and second(item)
+        return lambda item: all(check(item) for check in checks)
+
+
+@lru_cache(maxsize=128)
+def get_search_filter(name_filter: str = "", ext_filter: str = "", path_filter: str = "", exclude_path_filter: str = "", use_regex: bool = False) -> SearchFilter:
+    """Return a SearchFilter, reusing the compiled one from an identical earlier search"""
+    return SearchFilter(name_filter, ext_filter, path_filter, exclude_path_filter, use_regex)
 
 
 class FileIndexer:
@@ -214,9 +435,23 @@ class FileIndexer:
         
         self.init_master_db()
         
+    def _connect(self, db_path: str, synchronous: str = 'OFF', **kwargs):
+        """Open a SQLite connection in autocommit mode with tuned PRAGMAs.
+        Folder indexes can always be rebuilt, so they skip fsync by default;
+        the master DB passes synchronous='NORMAL'.
+        """
+        conn = sqlite3.connect(db_path, isolation_level=None, **kwargs)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(f'PRAGMA synchronous={synchronous}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')  # 64 MB
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MB
+        conn.create_function('REGEXP', 2, sql_regexp, deterministic=True)
+        return conn
+        
     def init_master_db(self):
         """Initialize master database connection and schema"""
-        conn = sqlite3.connect(self.master_db_path, check_same_thread=False)
+        conn = self._connect(self.master_db_path, synchronous='NORMAL', check_same_thread=False)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -234,6 +469,12 @@ class FileIndexer:
         except sqlite3.OperationalError:
             cursor.execute('ALTER TABLE indexed_folders ADD COLUMN last_updated TEXT')
         
+        # Row count of each folder DB, so stats don't have to open every DB
+        try:
+            cursor.execute('SELECT file_count FROM indexed_folders LIMIT 1')
+        except sqlite3.OperationalError:
+            cursor.execute('ALTER TABLE indexed_folders ADD COLUMN file_count INTEGER')
+        
         conn.commit()
         conn.close()
         
@@ -243,7 +484,7 @@ class FileIndexer:
         
     def init_folder_db(self, db_path: str):
         """Initialize a folder-specific database"""
-        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn = self._connect(db_path, check_same_thread=False)
         cursor = conn.cursor()
         
         # Files table
@@ -262,15 +503,39 @@ class FileIndexer:
         # Create indices for speed
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_name ON files(name)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_ext ON files(extension)')
+        self._ensure_fts(cursor)
         
         conn.commit()
         conn.close()
+    
+    def _ensure_fts(self, cursor) -> bool:
+        """Create the trigram FTS5 table over file names if SQLite supports it"""
+        try:
+            # External content: the text lives in files, FTS only keeps the trigram index
+            cursor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5("
+                "name, content='files', content_rowid='id', tokenize='trigram')"
+            )
+            # Keep FTS in step with incremental updates (paths, and so names, never change in place)
+            cursor.execute(
+                "CREATE TRIGGER IF NOT EXISTS files_fts_insert AFTER INSERT ON files BEGIN "
+                "INSERT INTO files_fts(rowid, name) VALUES (new.id, new.name); END"
+            )
+            cursor.execute(
+                "CREATE TRIGGER IF NOT EXISTS files_fts_delete AFTER DELETE ON files BEGIN "
+                "INSERT INTO files_fts(files_fts, rowid, name) VALUES ('delete', old.id, old.name); END"
+            )
+            return True
+        except sqlite3.OperationalError as e:
+            # FTS5 or the trigram tokenizer (SQLite 3.34+) is not available
+            print(f"Full-text index unavailable: {e}")
+            return False
         
     def add_folder(self, path: str):
         """Add folder to indexed folders list and create its DB"""
         path = os.path.abspath(path)
         try:
-            conn = sqlite3.connect(self.master_db_path)
+            conn = self._connect(self.master_db_path, synchronous='NORMAL')
             cursor = conn.cursor()
             
             # Check if already exists
@@ -280,7 +545,7 @@ class FileIndexer:
                 return True
             
             # Generate unique filename based on hash of path
-            path_hash = hashlib.md5(path.encode('utf-8')).hexdigest()
+            path_hash = hashlib.blake2b(path.encode('utf-8'), digest_size=16).hexdigest()
             db_filename = f"{path_hash}.db"
             
             # Add initial last_updated timestamp
@@ -300,7 +565,7 @@ class FileIndexer:
         """Remove folder from indexed folders list and delete its DB"""
         path = os.path.abspath(path)
         try:
-            conn = sqlite3.connect(self.master_db_path)
+            conn = self._connect(self.master_db_path, synchronous='NORMAL')
             cursor = conn.cursor()
             
             cursor.execute('SELECT db_filename FROM indexed_folders WHERE path = ?', (path,))
@@ -312,12 +577,13 @@ class FileIndexer:
                 
                 # Close any connections to this DB (not strictly managed here but good practice to ensure)
                 
-                # Delete DB file
-                if os.path.exists(db_path):
-                    try:
-                        os.remove(db_path)
-                    except Exception as e:
-                        print(f"Error deleting DB file {db_path}: {e}")
+                # Delete DB file and its WAL side files
+                for file_path in (db_path, db_path + '-wal', db_path + '-shm'):
+                    if os.path.exists(file_path):
+                        try:
+                            os.remove(file_path)
+                        except Exception as e:
+                            print(f"Error deleting DB file {file_path}: {e}")
                 
                 # Remove from master
                 cursor.execute('DELETE FROM indexed_folders WHERE path = ?', (path,))
@@ -332,7 +598,7 @@ class FileIndexer:
     def get_indexed_folders(self) -> List[str]:
         """Get list of indexed folders"""
         try:
-            conn = sqlite3.connect(self.master_db_path)
+            conn = self._connect(self.master_db_path, synchronous='NORMAL')
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute('SELECT path FROM indexed_folders')
@@ -345,7 +611,7 @@ class FileIndexer:
     def get_indexed_folders_details(self) -> List[tuple]:
         """Get list of indexed folders with details (path, last_updated)"""
         try:
-            conn = sqlite3.connect(self.master_db_path)
+            conn = self._connect(self.master_db_path, synchronous='NORMAL')
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute('SELECT path, last_updated FROM indexed_folders')
@@ -364,7 +630,7 @@ class FileIndexer:
                     os.remove(os.path.join(self.indexes_dir, f))
             
             # Clear master table
-            conn = sqlite3.connect(self.master_db_path)
+            conn = self._connect(self.master_db_path, synchronous='NORMAL')
             cursor = conn.cursor()
             cursor.execute('DELETE FROM indexed_folders')
             conn.commit()
@@ -379,88 +645,202 @@ class FileIndexer:
         folder_path = os.path.abspath(folder_path)
         
         # Get DB filename
-        conn_master = sqlite3.connect(self.master_db_path)
-        cursor_master = conn_master.cursor()
-        cursor_master.execute('SELECT db_filename FROM indexed_folders WHERE path = ?', (folder_path,))
-        row = cursor_master.fetchone()
-        
-        if not row:
-            conn_master.close()
-            return
+        conn_master = self._connect(self.master_db_path, synchronous='NORMAL')
+        conn = None
+        scan = None
+        try:
+            cursor_master = conn_master.cursor()
+            cursor_master.execute('SELECT db_filename FROM indexed_folders WHERE path = ?', (folder_path,))
+            row = cursor_master.fetchone()
             
-        db_path = self.get_folder_db_path(row[0])
-        
-        # Connect to folder DB
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+            if not row:
+                return
+                
+            db_path = self.get_folder_db_path(row[0])
+            
+            # Connect to folder DB (autocommit; the rebuild transaction is explicit)
+            conn = self._connect(db_path)
+            cursor = conn.cursor()
+            
+            if not os.path.exists(folder_path):
+                cursor.execute('DELETE FROM files')
+                cursor_master.execute('UPDATE indexed_folders SET file_count = 0 WHERE path = ?', (folder_path,))
+                return
+            
+            # The whole update runs in one transaction; IMMEDIATE takes the write lock up front
+            # so a concurrent writer waits at BEGIN (sqlite3 connect timeout) instead of failing mid-way
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                # An empty index is bulk-loaded; an existing one is only patched where the disk changed
+                incremental = cursor.execute('SELECT 1 FROM files LIMIT 1').fetchone() is not None
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'files_fts_insert'")
+                fts_synced = incremental and cursor.fetchone() is not None
+                
+                if incremental:
+                    # Paths seen by this walk; everything else is deleted at the end
+                    cursor.execute('CREATE TEMP TABLE IF NOT EXISTS seen_paths (path TEXT PRIMARY KEY)')
+                    cursor.execute('DELETE FROM seen_paths')
+                    if not fts_synced:
+                        self._ensure_fts(cursor)
+                else:
+                    # Bulk load without indexes or FTS triggers; they are rebuilt in one pass before COMMIT
+                    cursor.execute('DROP INDEX IF EXISTS idx_name')
+                    cursor.execute('DROP INDEX IF EXISTS idx_ext')
+                    cursor.execute('DROP TRIGGER IF EXISTS files_fts_insert')
+                    cursor.execute('DROP TRIGGER IF EXISTS files_fts_delete')
+                
+                count = 0
+                batch_size = 5000
+                rows = []
+                
+                def flush():
+                    if incremental:
+                        self._insert_rows(cursor, UPSERT_FILE_SQL, rows)
+                        cursor.executemany('INSERT OR IGNORE INTO seen_paths VALUES (?)', [(row[0],) for row in rows])
+                    else:
+                        self._insert_rows(cursor, INSERT_FILE_SQL, rows)
+                    rows.clear()
+                
+                # Walker threads read the tree; this thread is the only SQLite writer
+                scan = self._scan_folder(folder_path, cancel_check)
+                for batch, file_count in scan:
+                    rows.extend(batch)
+                    if progress_callback and (count + file_count) // 100 > count // 100:
+                        progress_callback(count + file_count)
+                    count += file_count
+                    
+                    if len(rows) >= batch_size:
+                        flush()
+                
+                if cancel_check and cancel_check():
+                    # Keep the previous index instead of a partial one
+                    cursor.execute('ROLLBACK')
+                    return
+
+                if rows:
+                    flush()
+                
+                if incremental:
+                    cursor.execute('DELETE FROM files WHERE path NOT IN (SELECT path FROM seen_paths)')
+                    cursor.execute('DELETE FROM seen_paths')
+                else:
+                    cursor.execute('CREATE INDEX idx_name ON files(name)')
+                    cursor.execute('CREATE INDEX idx_ext ON files(extension)')
+                if not fts_synced and self._ensure_fts(cursor):
+                    cursor.execute("INSERT INTO files_fts(files_fts) VALUES('rebuild')")
+                file_count = cursor.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+                cursor.execute('COMMIT')
+            except BaseException:
+                # Errors and progress_callback stops (e.g. IdleMonitor) also keep the previous index
+                if conn.in_transaction:
+                    cursor.execute('ROLLBACK')
+                raise
+            
+            # Fold the rebuild back into the main DB file and reset the WAL
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            
+            # Update last_updated timestamp and row count in master DB
+            try:
+                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                cursor_master.execute(
+                    'UPDATE indexed_folders SET last_updated = ?, file_count = ? WHERE path = ?',
+                    (current_time, file_count, folder_path)
+                )
+                conn_master.commit()
+            except Exception as e:
+                print(f"Error updating timestamp: {e}")
+        finally:
+            if scan is not None:
+                scan.close()  # Stops and drains the walkers if the loop was left early
+            if conn is not None:
+                conn.close()
+            conn_master.close()
         
-        # Clear existing files for this folder (full rebuild for the folder)
-        cursor.execute('DELETE FROM files')
-        conn.commit()
+    def _scan_folder(self, folder_path: str, cancel_check=None):
+        """Walk folder_path with parallel scandir workers, yielding (rows, file_count) batches"""
+        dir_queue = queue.Queue()
+        row_queue = queue.Queue(maxsize=20)  # Bounded so walkers can't run far ahead of the writer
+        stop = threading.Event()
+        worker_count = min(8, os.cpu_count() or 1)
         
-        if not os.path.exists(folder_path):
-            conn_master.close()
-            return
+        def scan_dir(root):
+            rows = []
+            file_count = 0
+            try:
+                # Type and stat come from the directory listing (FindNextFileW data on Windows,
+                # so no per-entry stat call); only symlinks need an extra lookup
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                rows.append((entry.path, entry.name, '', 0, entry.stat().st_mtime, True))
+                                # Like os.walk, list symlinked folders but don't descend into them
+                                if not entry.is_symlink():
+                                    dir_queue.put(entry.path)
+                            else:
+                                stat = entry.stat()
+                                ext = get_extension(entry.name)
+                                rows.append((entry.path, entry.name, ext, stat.st_size, stat.st_mtime, False))
+                                file_count += 1
+                        except OSError:
+                            pass
+                        
+                        if len(rows) >= 500:
+                            row_queue.put((rows, file_count))
+                            rows = []
+                            file_count = 0
+            except OSError:
+                pass
             
-        count = 0
-        batch_count = 0
-        batch_size = 1000
+            if rows:
+                row_queue.put((rows, file_count))
         
-        for root, dirs, files in os.walk(folder_path):
-            # Insert directories
-            for d in dirs:
-                full_path = os.path.join(root, d)
-                try:
-                    stat = os.stat(full_path)
-                    cursor.execute(
-                        'INSERT INTO files (path, name, extension, size, mtime, is_dir) VALUES (?, ?, ?, ?, ?, ?)',
-                        (full_path, d, '', 0, stat.st_mtime, True)
-                    )
-                    batch_count += 1
-                except:
-                    pass
-                    
-            # Insert files
-            for f in files:
-                full_path = os.path.join(root, f)
+        def walker():
+            while True:
+                root = dir_queue.get()
+                if root is None:
+                    break
                 try:
-                    stat = os.stat(full_path)
-                    ext = os.path.splitext(f)[1]
-                    cursor.execute(
-                        'INSERT INTO files (path, name, extension, size, mtime, is_dir) VALUES (?, ?, ?, ?, ?, ?)',
-                        (full_path, f, ext, stat.st_size, stat.st_mtime, False)
-                    )
-                    count += 1
-                    batch_count += 1
-                    
-                    if progress_callback and count % 100 == 0:
-                        progress_callback(count)
-                    
-                    if batch_count >= batch_size:
-                        conn.commit()
-                        batch_count = 0
-                        
-                except:
-                    pass
-        
-        if cancel_check and cancel_check():
-            conn.close()
-            return
-
-        if batch_count > 0:
-            conn.commit()
-            
-        conn.close()
+                    if not stop.is_set() and not (cancel_check and cancel_check()):
+                        scan_dir(root)
+                finally:
+                    dir_queue.task_done()
+        
+        def finish():
+            # Every queued folder has been scanned (or skipped): release walkers and the writer
+            dir_queue.join()
+            for _ in range(worker_count):
+                dir_queue.put(None)
+            row_queue.put(None)
+        
+        dir_queue.put(folder_path)
+        for _ in range(worker_count):
+            threading.Thread(target=walker, daemon=True).start()
+        threading.Thread(target=finish, daemon=True).start()
         
-        # Update last_updated timestamp in master DB
         try:
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            cursor_master.execute('UPDATE indexed_folders SET last_updated = ? WHERE path = ?', (current_time, folder_path))
-            conn_master.commit()
-        except Exception as e:
-            print(f"Error updating timestamp: {e}")
-            
-        conn_master.close()
+            while True:
+                batch = row_queue.get()
+                if batch is None:
+                    break
+                yield batch
+        finally:
+            # If the writer stops early, let blocked walkers drain out
+            stop.set()
+            while batch is not None:
+                batch = row_queue.get()
+    
+    def _insert_rows(self, cursor, sql, rows):
+        """Insert a batch of rows, falling back to one at a time if the batch fails"""
+        try:
+            cursor.executemany(sql, rows)
+        except (sqlite3.Error, UnicodeError):
+            # Skip only the offending rows (e.g. paths that cannot be encoded)
+            for row in rows:
+                try:
+                    cursor.execute(sql, row)
+                except (sqlite3.Error, UnicodeError):
+                    pass
         
     def update_index(self, progress_callback=None, cancel_check=None):
         """Rebuild index for all folders"""
@@ -504,8 +884,7 @@ class FileIndexer:
             return
             
         try:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._connect(db_path)
             cursor = conn.cursor()
             
             query = "SELECT path, size, mtime FROM files WHERE 1=1"
@@ -518,20 +897,41 @@ class FileIndexer:
             
             # Apply basic SQL filters if not using regex
             if not search_filter.use_regex and search_filter.name_filters:
-                conditions = []
-                for nf in search_filter.name_filters:
-                    conditions.append("name LIKE ?")
-                    params.append(f"%{nf}%")
-                if conditions:
-                    query += " AND (" + " OR ".join(conditions) + ")"
+                # Trigram full-text index answers substring matches of 3+ characters
+                use_fts = all(len(nf) >= 3 for nf in search_filter.name_filters)
+                if use_fts:
+                    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'files_fts'")
+                    use_fts = cursor.fetchone() is not None
+                
+                if use_fts:
+                    query += " AND id IN (SELECT rowid FROM files_fts WHERE files_fts MATCH ?)"
+                    params.append(" OR ".join('"' + nf.replace('"', '""') + '"'
+                                              for nf in search_filter.name_filters))
+                else:
+                    conditions = []
+                    for nf in search_filter.name_filters:
+                        conditions.append("name LIKE ?")
+                        params.append(f"%{nf}%")
+                    if conditions:
+                        query += " AND (" + " OR ".join(conditions) + ")"
                     
             if not search_filter.use_regex and search_filter.ext_filters:
-                conditions = []
-                for ef in search_filter.ext_filters:
-                    conditions.append("extension LIKE ?")
-                    params.append(f"%{ef}%")
-                if conditions:
-                    query += " AND (" + " OR ".join(conditions) + ")"
+                # Same exact, case-insensitive comparison that matches() applies
+                query += " AND extension COLLATE NOCASE IN (" + ", ".join("?" * len(search_filter.ext_filters)) + ")"
+                params.extend(search_filter.ext_filters)
+            
+            # Regex mode: evaluate every filter inside SQLite so only matching rows come back
+            if search_filter.use_regex:
+                for column, patterns, exclude in (
+                    ("path", search_filter.exclude_path_filters, True),
+                    ("name", search_filter.name_filters, False),
+                    ("extension", search_filter.ext_filters, False),
+                    ("path", search_filter.path_filters, False),
+                ):
+                    if patterns:
+                        clause = " OR ".join(f"{column} REGEXP ?" for _ in patterns)
+                        query += f" AND NOT ({clause})" if exclude else f" AND ({clause})"
+                        params.extend(pattern.pattern for pattern in patterns)
             
             cursor.execute(query, params)
             
@@ -539,14 +939,15 @@ class FileIndexer:
             current_batch = []
             count = 0
             
-            for row in cursor.fetchall():
+            # Plain tuples straight from the cursor; no Row objects or full fetchall() list
+            for path, size, mtime in cursor:
                 if cancel_check and count % 100 == 0 and cancel_check():
                     break
                     
                 try:
-                    item = FileItem(row['path'], row['size'], row['mtime'])
+                    item = FileItem(path, size, mtime)
                     
-                    if search_filter.matches(item):
+                    if search_filter.use_regex or search_filter.matches(item):
                         current_batch.append(item)
                         
                         if len(current_batch) >= batch_size:
@@ -579,16 +980,19 @@ class FileIndexer:
             callback: Function to call with a batch of results (List[FileItem])
         """
         # Get all folder DBs
-        conn_master = sqlite3.connect(self.master_db_path)
+        conn_master = self._connect(self.master_db_path, synchronous='NORMAL')
         conn_master.row_factory = sqlite3.Row
         cursor_master = conn_master.cursor()
         cursor_master.execute('SELECT path, db_filename FROM indexed_folders')
         folders = cursor_master.fetchall()
         conn_master.close()
         
+        if not folders:
+            return []
+        
         # Use ThreadPoolExecutor for parallel search
-        # Limit max workers to avoid overwhelming the system, but at least 1
-        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        # A few workers overlap I/O; more just contend for the GIL and disk
+        max_workers = min(4, len(folders))
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = []
@@ -617,24 +1021,31 @@ class FileIndexer:
         folder_count = 0
         
         try:
-            conn_master = sqlite3.connect(self.master_db_path)
+            conn_master = self._connect(self.master_db_path, synchronous='NORMAL')
             cursor_master = conn_master.cursor()
-            cursor_master.execute('SELECT db_filename FROM indexed_folders')
-            db_files = [row[0] for row in cursor_master.fetchall()]
-            folder_count = len(db_files)
-            conn_master.close()
+            cursor_master.execute('SELECT db_filename, file_count FROM indexed_folders')
+            rows = cursor_master.fetchall()
+            folder_count = len(rows)
             
-            for db_file in db_files:
-                db_path = self.get_folder_db_path(db_file)
-                if os.path.exists(db_path):
-                    try:
-                        conn = sqlite3.connect(db_path)
-                        cursor = conn.cursor()
-                        cursor.execute('SELECT COUNT(*) FROM files')
-                        total_files += cursor.fetchone()[0]
-                        conn.close()
-                    except:
-                        pass
+            for db_file, file_count in rows:
+                if file_count is None:
+                    # Indexed before counts were stored: count once and remember it
+                    file_count = 0
+                    db_path = self.get_folder_db_path(db_file)
+                    if os.path.exists(db_path):
+                        try:
+                            conn = self._connect(db_path)
+                            file_count = conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+                            conn.close()
+                        except:
+                            pass
+                    cursor_master.execute(
+                        'UPDATE indexed_folders SET file_count = ? WHERE db_filename = ?',
+                        (file_count, db_file)
+                    )
+                total_files += file_count
+            
+            conn_master.close()
         except:
             pass
             
@@ -644,6 +1055,21 @@ class FileIndexer:
 class FileSearchApp:
     """Main application class"""
     
+    # Toggle switch style checkbox icons per theme (built once, shared by every instance)
+    CHECK_IMAGES = {
+        "light": {
+            'checked': '🟦',    # Blue square for checked
+            'unchecked': '⬜'   # White square for unchecked
+        },
+        "dark": {
+            'checked': '🟦',    # Blue square for checked
+            'unchecked': '⬜'   # White square for unchecked
+        },
+    }
+    
+    # Parsed language files: path -> ((mtime_ns, size), {key: text})
+    LANG_CACHE: Dict[str, tuple] = {}
+    
     # Default English translations
     DEFAULT_TRANSLATIONS = {
         "title": "ezSLauncher",
@@ -774,6 +1200,7 @@ class FileSearchApp:
         "moved_to": "Moved to:",
         "success": "Success",
         "overwrite_confirm": "File already exists. Overwrite?",
+        "overwrite_all_confirm": "{0} file(s) already exist in the destination.\n\nYes: Overwrite all\nNo: Skip all\nCancel: Abort",
         "already_exists": "Already Exists",
         "replace_startup_shortcut": "Replace existing startup shortcut?",
         "added_to_startup": "Added to startup programs:",
@@ -827,11 +1254,14 @@ class FileSearchApp:
             self.current_language = "English"
             self.current_language_code = "en"
         
-        self.translations = self.DEFAULT_TRANSLATIONS.copy()
+        # English reads the defaults directly; other languages get a copy to layer onto
+        self.translations = self.DEFAULT_TRANSLATIONS
         
         # Load language file if not English
         if self.current_language_code != "en":
+            self.translations = self.DEFAULT_TRANSLATIONS.copy()
             self.load_language_file_by_code(self.current_language_code)
+        self.build_context_menu_labels()
         
         # Set title with correct language
         self.root.title(self.t("title"))
@@ -843,10 +1273,32 @@ class FileSearchApp:
         # Data storage
         self.search_results: List[FileItem] = []
         self.checked_items: Dict[str, bool] = {}
+        self._item_paths: Dict[str, str] = {}  # Tree item id -> file path
+        self._sort_keys: Dict[str, tuple] = {}  # Tree item id -> (size bytes, mtime, type)
+        self._item_index: Dict[str, int] = {}  # Tree item id -> row position (None = rebuild on use)
+        self._results_count = 0  # Number of rows in the results tree
         self.is_searching = False
         self.search_cancelled = False
         self.save_timer = None  # For debouncing save_settings
-        self.index_manager_window = None  # Track Index Manager window
+        self._saved_config_payload = None  # Last bytes written to CONFIG_FILE
+        self._saved_config_snapshot = None  # Setting values seen by the last save_settings
+        self._status_slot = None  # Latest status message posted from a worker thread
+        self._status_lock = threading.Lock()
+        self._pending_batches = []  # Result batches posted by search threads, not yet in the tree
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self.index_manager_window = None  # Track Index Manager window (hidden, not destroyed, on close)
+        self.index_manager_key = None  # (dark_mode, language) the window was built for
+        self.index_manager_refresh = None  # Reloads the window's folder list
+        self._wscript_shell = None  # Lazily created WScript.Shell COM object
+        self._file_item_cache = OrderedDict()  # path -> (timestamp, FileItem)
+        self._rename_dialog = None  # Reused rename dialog (built on first use)
+        self._about_window = None  # Reused About window (built on first use)
+        self._startup_folder = None  # Resolved by get_startup_folder()
+        self._startup_shortcut = None  # Resolved by get_startup_shortcut_path()
+        self._startup_enabled = None  # Cached check_startup_status() result
+        self.available_langs = None  # [(display name, code)], built by create_menu_bar()
+        self.applied_theme_name = None  # Theme last applied by apply_theme()
         
         # Dark mode state
         self.dark_mode = self.config.get("dark_mode", False)
@@ -902,6 +1354,9 @@ class FileSearchApp:
         
         self.use_index_var.trace_add('write', on_use_index_change)
 
+        # Shared ttk style handle for this root
+        self.style = ttk.Style(self.root)
+        
         # Create UI
         self.create_ui()
         
@@ -918,8 +1373,11 @@ class FileSearchApp:
         self.idle_monitor = IdleMonitor(self)
         self.idle_monitor.start()
         
-        # Check for updates on startup (after 3 seconds delay)
-        self.root.after(3000, self.check_for_updates_silent)
+        # Poll for status messages from worker threads
+        self.root.after(100, self.drain_status)
+        
+        # Check for updates on startup (3 seconds after the window first goes idle)
+        self.root.after_idle(self.root.after, 3000, self.check_for_updates_silent)
 
     def load_config(self):
         """Load configuration from JSON file"""
@@ -953,23 +1411,38 @@ class FileSearchApp:
         
         for lang_path in paths_to_try:
             print(f"Trying to load: {lang_path}")
-            if os.path.exists(lang_path):
+            try:
+                st = os.stat(lang_path)
+            except OSError:
+                st = None
+            if st is not None:
                 print(f"File exists: {lang_path}")
+                cached = self.LANG_CACHE.get(lang_path)
+                if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+                    self.translations.update(cached[1])
+                    print(f"Loaded {lang_file} from cache")
+                    return True
                 try:
-                    config = configparser.ConfigParser(interpolation=None)
                     # Read with UTF-8 encoding, stripping BOM if present
-                    config.read(lang_path, encoding='utf-8-sig')
+                    with open(lang_path, 'r', encoding='utf-8-sig') as f:
+                        ui = parse_ui_section(f.read())
                     
-                    if 'UI' in config:
-                        print(f"Found [UI] section with {len(config['UI'])} keys")
-                        for key in config['UI']:
-                            self.translations[key] = config['UI'][key]
-                        print(f"Successfully loaded {lang_file}")
-                        return True
-                    else:
-                        print(f"No [UI] section found in {lang_path}")
-                        print(f"Available sections: {config.sections()}")
-                        continue
+                    if ui is None:
+                        # Not a plain [UI] file: fall back to the full parser
+                        import configparser
+                        config = configparser.ConfigParser(interpolation=None)
+                        config.read(lang_path, encoding='utf-8-sig')
+                        if 'UI' not in config:
+                            print(f"No [UI] section found in {lang_path}")
+                            print(f"Available sections: {config.sections()}")
+                            continue
+                        ui = dict(config.items('UI', raw=True))
+                    
+                    print(f"Found [UI] section with {len(ui)} keys")
+                    self.LANG_CACHE[lang_path] = ((st.st_mtime_ns, st.st_size), ui)
+                    self.translations.update(ui)
+                    print(f"Successfully loaded {lang_file}")
+                    return True
                 except Exception as e:
                     print(f"Error reading {lang_path}: {type(e).__name__}: {e}")
                     import traceback
@@ -985,29 +1458,40 @@ class FileSearchApp:
         """Get translation for key"""
         return self.translations.get(key, key)
     
+    def build_context_menu_labels(self):
+        """Pre-format context menu labels for the current language"""
+        labels = {}
+        for key, icon in (("copy_to", "📋"), ("move_to", "📦"), ("add_to_startup", "🚀")):
+            labels[key] = MENU_LABEL_TEMPLATE % (icon, self.t(key))
+            # Leaves a %d placeholder for the checked file count
+            labels[key + "_count"] = MENU_COUNT_LABEL_TEMPLATE % (icon, self.t(key), self.t("files"))
+        self.context_menu_labels = labels
+    
     def set_icon(self):
         """Set application icon if available"""
+        self.icon_path = None
+        self.icon_is_default = False  # True once every new Toplevel inherits the icon
         try:
-            # Try to load icon from icon folder
-            icon_path = resource_path(os.path.join("icon", "icon.ico"))
-            if os.path.exists(icon_path):
-                self.root.iconbitmap(icon_path)
-                self.icon_path = icon_path
-            else:
-                # Fallback to root directory
-                icon_path = resource_path("icon.ico")
-                if os.path.exists(icon_path):
-                    self.root.iconbitmap(icon_path)
+            # Try the icon folder first, then fall back to the root directory
+            for icon_path in (resource_path(os.path.join("icon", "icon.ico")), resource_path("icon.ico")):
+                if os.path.isfile(icon_path):
                     self.icon_path = icon_path
+                    break
+            
+            if self.icon_path:
+                if sys.platform == 'win32':
+                    # Default icon for this window and every Toplevel created later
+                    self.root.iconbitmap(default=self.icon_path)
+                    self.icon_is_default = True
                 else:
-                    self.icon_path = None
+                    self.root.iconbitmap(self.icon_path)
         except Exception as e:
             print(f"Failed to load icon: {e}")
             self.icon_path = None
     
     def set_window_icon(self, window):
         """Set icon for a specific window"""
-        if self.icon_path:
+        if self.icon_path and not self.icon_is_default:
             try:
                 window.iconbitmap(self.icon_path)
             except Exception as e:
@@ -1015,75 +1499,78 @@ class FileSearchApp:
     
     def create_menu_bar(self):
         """Create menu bar"""
+        t = self.t  # Local alias for the many label lookups below
+        self.menu_entries = []  # (menu, index, translation key) for retranslate_menus()
+        
+        def add_entry(menu, kind, key, **options):
+            menu.add(kind, label=t(key), **options)
+            self.menu_entries.append((menu, menu.index('end'), key))
+        
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=self.t("menu_file"), menu=file_menu)
+        add_entry(menubar, 'cascade', "menu_file", menu=file_menu)
         
         # Language submenu
         lang_menu = tk.Menu(file_menu, tearoff=0)
         
-        # Language display name to code mapping
-        self.language_map = {
-            "English": "en",
-            "한국어": "ko",
-            "Korean": "ko"
-        }
-        
-        # Available languages (display name -> code)
-        available_langs = [("English", "en")]
-        
-        # Check for Korean language file
-        lang_ko_path = resource_path(os.path.join("language", "lang_ko.ini"))
-        if os.path.exists(lang_ko_path):
-            available_langs.append(("한국어", "ko"))
+        # Available languages (display name -> code), probed once
+        if self.available_langs is None:
+            self.available_langs = [("English", "en")]
+            
+            # Check for Korean language file
+            lang_ko_path = resource_path(os.path.join("language", "lang_ko.ini"))
+            if os.path.exists(lang_ko_path):
+                self.available_langs.append(("한국어", "ko"))
         
-        for lang_display, lang_code in available_langs:
+        for lang_display, lang_code in self.available_langs:
             lang_menu.add_command(
                 label=lang_display, 
                 command=lambda ld=lang_display, lc=lang_code: self.change_language(lc, ld)
             )
         
-        file_menu.add_cascade(label=self.t("menu_language"), menu=lang_menu)
+        add_entry(file_menu, 'cascade', "menu_language", menu=lang_menu)
         
         # Create BooleanVar for dark mode and keep reference
         self.dark_mode_var = tk.BooleanVar(value=self.dark_mode)
-        file_menu.add_checkbutton(
-            label=self.t("menu_dark_mode"), 
-            command=self.toggle_dark_mode,
-            variable=self.dark_mode_var
-        )
+        add_entry(file_menu, 'checkbutton', "menu_dark_mode",
+                  command=self.toggle_dark_mode,
+                  variable=self.dark_mode_var)
         
         file_menu.add_separator()
         
         # Run on Startup
         self.run_on_startup_var = tk.BooleanVar(value=self.check_startup_status())
-        file_menu.add_checkbutton(
-            label=self.t("menu_run_on_startup"),
-            command=self.toggle_run_on_startup,
-            variable=self.run_on_startup_var
-        )
+        add_entry(file_menu, 'checkbutton', "menu_run_on_startup",
+                  command=self.toggle_run_on_startup,
+                  variable=self.run_on_startup_var)
         
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         
         # Indexing menu
         index_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=self.t("menu_indexing"), menu=index_menu)
-        index_menu.add_checkbutton(label=self.t("menu_enable_index"), variable=self.use_index_var)
+        add_entry(menubar, 'cascade', "menu_indexing", menu=index_menu)
+        add_entry(index_menu, 'checkbutton', "menu_enable_index", variable=self.use_index_var)
         index_menu.add_separator()
-        index_menu.add_command(label=self.t("menu_manage_index"), command=self.show_index_manager)
+        add_entry(index_menu, 'command', "menu_manage_index", command=self.show_index_manager)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label=self.t("menu_help_top"), menu=help_menu)
-        help_menu.add_command(label=self.t("menu_check_update"), command=self.check_for_updates)
+        add_entry(menubar, 'cascade', "menu_help_top", menu=help_menu)
+        add_entry(help_menu, 'command', "menu_check_update", command=self.check_for_updates)
         help_menu.add_separator()
-        help_menu.add_command(label=self.t("menu_github"), command=self.open_github)
+        add_entry(help_menu, 'command', "menu_github", command=self.open_github)
         help_menu.add_separator()
-        help_menu.add_command(label=self.t("menu_about"), command=self.show_about)
+        add_entry(help_menu, 'command', "menu_about", command=self.show_about)
+    
+    def retranslate_menus(self):
+        """Relabel existing menu entries for the current language"""
+        t = self.t
+        for menu, index, key in self.menu_entries:
+            menu.entryconfigure(index, label=t(key))
     
     def toggle_dark_mode(self):
         """Toggle between light and dark mode"""
@@ -1097,20 +1584,46 @@ class FileSearchApp:
         self.update_status(self.t("dark_mode_enabled") if self.dark_mode else self.t("dark_mode_disabled"))
         self.save_settings()
     
+    def get_startup_folder(self) -> str:
+        """Get the user's Startup folder (resolved once)"""
+        if self._startup_folder is None:
+            folder = None
+            try:
+                path_ptr = ctypes.c_wchar_p()
+                hr = ctypes.windll.shell32.SHGetKnownFolderPath(
+                    ctypes.byref(FOLDERID_Startup), 0, None, ctypes.byref(path_ptr)
+                )
+                if hr == 0:
+                    folder = path_ptr.value
+                ctypes.windll.ole32.CoTaskMemFree(path_ptr)
+            except Exception as e:
+                print(f"SHGetKnownFolderPath failed: {e}")
+            
+            if not folder:
+                folder = os.path.join(
+                    os.environ['APPDATA'],
+                    r'Microsoft\Windows\Start Menu\Programs\Startup'
+                )
+            self._startup_folder = folder
+        return self._startup_folder
+    
+    def get_startup_shortcut_path(self) -> str:
+        """Path of this app's shortcut in the Startup folder (built once)"""
+        if self._startup_shortcut is None:
+            self._startup_shortcut = os.path.join(self.get_startup_folder(), "ezSLauncher.lnk")
+        return self._startup_shortcut
+    
     def check_startup_status(self) -> bool:
         """Check if application is set to run on startup"""
         if sys.platform != 'win32':
             return False
-            
-        try:
-            startup_folder = os.path.join(
-                os.environ['APPDATA'],
-                r'Microsoft\Windows\Start Menu\Programs\Startup'
-            )
-            shortcut_path = os.path.join(startup_folder, "ezSLauncher.lnk")
-            return os.path.exists(shortcut_path)
-        except:
-            return False
+        
+        if self._startup_enabled is None:
+            try:
+                self._startup_enabled = os.path.exists(self.get_startup_shortcut_path())
+            except:
+                return False
+        return self._startup_enabled
 
     def toggle_run_on_startup(self):
         """Toggle run on startup setting"""
@@ -1120,17 +1633,11 @@ class FileSearchApp:
             return
 
         try:
-            import win32com.client
-            
-            startup_folder = os.path.join(
-                os.environ['APPDATA'],
-                r'Microsoft\Windows\Start Menu\Programs\Startup'
-            )
-            shortcut_path = os.path.join(startup_folder, "ezSLauncher.lnk")
+            shortcut_path = self.get_startup_shortcut_path()
             
             if self.run_on_startup_var.get():
                 # Enable: Create shortcut
-                shell = win32com.client.Dispatch("WScript.Shell")
+                shell = self._get_wscript_shell()
                 shortcut = shell.CreateShortCut(shortcut_path)
                 
                 if getattr(sys, 'frozen', False):
@@ -1147,11 +1654,13 @@ class FileSearchApp:
                 shortcut.IconLocation = target
                 shortcut.save()
                 
+                self._startup_enabled = True
                 self.update_status("Added to startup")
             else:
                 # Disable: Remove shortcut
                 if os.path.exists(shortcut_path):
                     os.remove(shortcut_path)
+                self._startup_enabled = False
                 self.update_status("Removed from startup")
                 
         except Exception as e:
@@ -1161,10 +1670,14 @@ class FileSearchApp:
     
     def apply_theme(self):
         """Apply current theme to all widgets"""
-        theme = self.themes["dark" if self.dark_mode else "light"]
+        theme_name = "dark" if self.dark_mode else "light"
+        if theme_name == self.applied_theme_name:
+            return  # Widgets already carry this theme
+        self.applied_theme_name = theme_name
+        theme = self.themes[theme_name]
         
         # Configure ttk styles globally
-        style = ttk.Style()
+        style = self.style
         
         # Set global ttk theme
         style.theme_use('default')
@@ -1223,177 +1736,107 @@ class FileSearchApp:
                        foreground=theme["labelframe_fg"],
                        font=('Segoe UI', 9, 'bold'))
         
-        # Increase Treeview row height by 50%
-        style.configure("Treeview", rowheight=30)
+        # Treeview - increase row height by 50%
+        style.configure("Treeview",
+                       background=theme["tree_bg"],
+                       foreground=theme["tree_fg"],
+                       fieldbackground=theme["tree_bg"],
+                       borderwidth=0,
+                       rowheight=30)
+        style.map('Treeview',
+                 background=[('selected', theme["select_bg"])],
+                 foreground=[('selected', theme["select_fg"])])
+        style.configure("Treeview.Heading",
+                       background=theme["button_bg"],
+                       foreground=theme["fg"],
+                       borderwidth=1)
+        style.map("Treeview.Heading",
+                 background=[('active', theme["select_bg"])])
+        
+        # Scrollbar - Windows 11 style (same for both vertical and horizontal)
+        if self.dark_mode:
+            style.configure("TScrollbar",
+                           background="#3d3d3d",      # Scrollbar thumb
+                           troughcolor="#1a1a1a",     # Track background
+                           borderwidth=0,
+                           arrowcolor="#ffffff")
+            style.map("TScrollbar",
+                     background=[('active', '#4d4d4d'), ('pressed', '#5d5d5d')])
+        else:
+            style.configure("TScrollbar",
+                           background="#c2c3c2",      # Scrollbar thumb
+                           troughcolor="#f3f3f3",     # Track background
+                           borderwidth=0,
+                           arrowcolor="#605e5c")
+            style.map("TScrollbar",
+                     background=[('active', '#a6a6a6'), ('pressed', '#8d8d8d')])
         
         # Apply to root window
         self.root.configure(bg=theme["bg"])
         
-        # Apply to all widgets recursively
+        # Apply to all non-ttk widgets recursively (ttk styles are global and set above)
         self.apply_theme_recursive(self.root, theme)
         
         # Update treeview styling (zebra striping and hover colors)
         if hasattr(self, 'tree'):
+            # Row tags are theme-independent: re-configuring them recolors every row
             self.setup_treeview_styling()
-            # Refresh all items to apply new colors
-            for item in self.tree.get_children():
-                self.update_item_tags(item, hover=False)
+            if self.last_hover_item and self.tree.exists(self.last_hover_item):
+                self.update_item_tags(self.last_hover_item, hover=False)
+            self.last_hover_item = None
+            self._hover_band = None
         
         # Update checkbox images for new theme
         if hasattr(self, 'check_images'):
+            old_images = self.check_images
             self.create_check_images()
-            # Update all checkbox icons in tree
-            if hasattr(self, 'tree') and hasattr(self, 'checked_items'):
+            # Update all checkbox icons in tree (only if the glyphs differ between themes)
+            if old_images != self.check_images and hasattr(self, 'tree') and hasattr(self, 'checked_items'):
                 for item_id in self.tree.get_children():
-                    current_text = self.tree.item(item_id, "text")
                     is_checked = self.checked_items.get(item_id, False)
-                    icon = self.check_images['checked'] if is_checked else self.check_images['unchecked']
-                    new_text = icon + current_text[1:]
-                    self.tree.item(item_id, text=new_text)
+                    self.tree.item(item_id, text=self.get_item_text(item_id, is_checked))
     
     def apply_theme_recursive(self, widget, theme):
-        """Recursively apply theme to all child widgets"""
-        try:
-            widget_class = widget.winfo_class()
-            
-            # Main window
-            if widget_class == "Tk":
-                widget.configure(bg=theme["bg"])
-            
-            # Frames and LabelFrames
-            elif widget_class in ["Frame", "TFrame"]:
-                if widget_class == "Frame":
-                    try:
-                        widget.configure(bg=theme["bg"])
-                    except:
-                        pass
-                else:
-                    # TFrame - use ttk style
-                    style = ttk.Style()
-                    style.configure("TFrame", background=theme["bg"])
-            
-            # LabelFrame styling
-            elif widget_class == "TLabelframe":
-                style = ttk.Style()
-                style.configure("TLabelframe", background=theme["labelframe_bg"], 
-                              foreground=theme["labelframe_fg"], borderwidth=2)
-                style.configure("TLabelframe.Label", background=theme["labelframe_bg"], 
-                              foreground=theme["labelframe_fg"])
-            
-            # Labels
-            elif widget_class in ["Label", "TLabel"]:
-                current_fg = None
-                try:
-                    current_fg = widget.cget("foreground")
-                except:
-                    pass
-                
-                if current_fg == "blue":
-                    try:
-                        widget.configure(bg=theme["bg"])
-                    except:
-                        pass
-                elif current_fg in ["gray", "#808080"]:
-                    try:
-                        widget.configure(bg=theme["bg"], fg=theme["tip_fg"])
-                    except:
-                        pass
-                else:
-                    try:
-                        widget.configure(bg=theme["bg"], fg=theme["fg"])
-                    except:
-                        pass
-            
-            # Buttons
-            elif widget_class in ["Button", "TButton"]:
-                style = ttk.Style()
-                style.configure("TButton", background=theme["button_bg"], 
-                              foreground=theme["fg"], borderwidth=1)
-                style.map("TButton",
-                         background=[('active', theme["select_bg"])],
-                         foreground=[('active', theme["select_fg"])])
-            
-            # Checkbuttons
-            elif widget_class in ["Checkbutton", "TCheckbutton"]:
-                style = ttk.Style()
-                style.configure("TCheckbutton", background=theme["bg"], foreground=theme["fg"])
-            
-            # Entries
-            elif widget_class in ["Entry", "TEntry"]:
-                try:
-                    if widget_class == "Entry":
-                        # tk.Entry widget
-                        widget.configure(
-                            bg=theme["entry_bg"], 
-                            fg=theme["entry_fg"], 
-                            insertbackground=theme["fg"],
-                            disabledbackground=theme["entry_bg"],
-                            disabledforeground=theme["tip_fg"],
-                            selectbackground=theme["select_bg"],
-                            selectforeground=theme["select_fg"]
-                        )
-                    else:
-                        # ttk.Entry widget
-                        style = ttk.Style()
-                        style.configure("TEntry",
-                                      fieldbackground=theme["entry_bg"],
-                                      foreground=theme["entry_fg"],
-                                      insertcolor=theme["fg"])
-                except:
-                    pass
-            
-            # Treeview
-            elif widget_class == "Treeview":
-                style = ttk.Style()
-                style.theme_use('default')
-                style.configure("Treeview",
-                              background=theme["tree_bg"],
-                              foreground=theme["tree_fg"],
-                              fieldbackground=theme["tree_bg"],
-                              borderwidth=0)
-                style.map('Treeview',
-                        background=[('selected', theme["select_bg"])],
-                        foreground=[('selected', theme["select_fg"])])
-                style.configure("Treeview.Heading",
-                              background=theme["button_bg"],
-                              foreground=theme["fg"],
-                              borderwidth=1)
-                style.map("Treeview.Heading",
-                        background=[('active', theme["select_bg"])])
-            
-            # Scrollbar - Windows 11 style (same for both vertical and horizontal)
-            elif widget_class in ["Scrollbar", "TScrollbar"]:
-                style = ttk.Style()
-                if self.dark_mode:
-                    # Dark theme scrollbar
-                    style.configure("TScrollbar",
-                                  background="#3d3d3d",      # Scrollbar thumb
-                                  troughcolor="#1a1a1a",     # Track background
-                                  borderwidth=0,
-                                  arrowcolor="#ffffff")
-                    style.map("TScrollbar",
-                            background=[('active', '#4d4d4d'), ('pressed', '#5d5d5d')])
-                else:
-                    # Light theme scrollbar
-                    style.configure("TScrollbar",
-                                  background="#c2c3c2",      # Scrollbar thumb
-                                  troughcolor="#f3f3f3",     # Track background
-                                  borderwidth=0,
-                                  arrowcolor="#605e5c")
-                    style.map("TScrollbar",
-                            background=[('active', '#a6a6a6'), ('pressed', '#8d8d8d')])
-            
-        except Exception as e:
-            pass
+        """Apply theme to widget and all of its descendants"""
+        bg = theme["bg"]
+        label_colors = {
+            "blue": {"bg": bg},
+            "gray": {"bg": bg, "fg": theme["tip_fg"]},
+            "#808080": {"bg": bg, "fg": theme["tip_fg"]},
+        }
+        label_default = {"bg": bg, "fg": theme["fg"]}
+        entry_colors = {
+            "bg": theme["entry_bg"],
+            "fg": theme["entry_fg"],
+            "insertbackground": theme["fg"],
+            "disabledbackground": theme["entry_bg"],
+            "disabledforeground": theme["tip_fg"],
+            "selectbackground": theme["select_bg"],
+            "selectforeground": theme["select_fg"],
+        }
         
-        # Recursively apply to children
-        for child in widget.winfo_children():
-            self.apply_theme_recursive(child, theme)
+        # Iterative walk; ttk widgets follow the global styles set in apply_theme
+        pending = deque([widget])
+        while pending:
+            widget = pending.popleft()
+            pending.extend(widget.winfo_children())
+            try:
+                widget_class = widget.winfo_class()
+                
+                if widget_class in ("Tk", "Frame"):
+                    widget.configure(bg=bg)
+                elif widget_class in ("Label", "TLabel"):
+                    # Keep blue links and gray tips distinguishable
+                    widget.configure(**label_colors.get(str(widget.cget("foreground")), label_default))
+                elif widget_class == "Entry":
+                    widget.configure(**entry_colors)
+            except Exception:
+                pass
     
     def create_ui(self):
         """Create user interface"""
         # Define styles
-        style = ttk.Style()
+        style = self.style
         style.configure("Red.TCheckbutton", foreground="red")
         
         # Create menu bar
@@ -1420,16 +1863,18 @@ class FileSearchApp:
     
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
-        # F5 - Search
-        self.root.bind('<F5>', lambda e: self.start_search())
-        
-        # Ctrl+A - Select All
-        self.root.bind('<Control-a>', lambda e: self.select_all())
-        self.root.bind('<Control-A>', lambda e: self.select_all())
-        
-        # Ctrl+D - Select None
-        self.root.bind('<Control-d>', lambda e: self.select_none())
-        self.root.bind('<Control-D>', lambda e: self.select_none())
+        window_shortcuts = (
+            (('<F5>',), self.start_search),                                 # Search
+            (('<Control-a>', '<Control-A>'), self.select_all),              # Select All
+            (('<Control-d>', '<Control-D>'), self.select_none),             # Select None
+            (('<Control-e>', '<Control-E>'), self.export_results),          # Export results
+            (('<Escape>',), lambda: self.stop_search() if self.is_searching else None),  # Stop search
+        )
+        for sequences, command in window_shortcuts:
+            # One Tcl command per action, shared by both letter cases
+            tcl_command = self.root.register(command)
+            for sequence in sequences:
+                self.root.bind(sequence, tcl_command)
         
         # Delete - Delete selected file
         self.tree.bind('<Delete>', self.on_delete_key)
@@ -1439,13 +1884,6 @@ class FileSearchApp:
         
         # Enter - Execute selected files
         self.tree.bind('<Return>', lambda e: self.execute_selected_files())
-        
-        # Ctrl+E - Export results
-        self.root.bind('<Control-e>', lambda e: self.export_results())
-        self.root.bind('<Control-E>', lambda e: self.export_results())
-        
-        # Escape - Stop search
-        self.root.bind('<Escape>', lambda e: self.stop_search() if self.is_searching else None)
     
     def on_delete_key(self, event):
         """Handle Delete key press"""
@@ -1465,50 +1903,56 @@ class FileSearchApp:
     
     def toggle_regex_tip(self):
         """Toggle regex tip visibility"""
-        if self.regex_var.get():
+        show = bool(self.regex_var.get())
+        if show == self.regex_tip_shown:
+            return  # Already in this state
+        self.regex_tip_shown = show
+        
+        if show:
             self.regex_tip.grid(row=6, column=0, columnspan=6, sticky=tk.W, pady=(2, 0))
         else:
             self.regex_tip.grid_remove()
         
         # Save settings when regex option changes
-        self.save_settings()
+        self.schedule_save_settings()
     
     def create_filter_section(self, parent):
         """Create search filter section"""
-        filter_frame = ttk.LabelFrame(parent, text=self.t("search_filters"), padding="10")
+        t = self.t  # Local alias for the many label lookups below
+        filter_frame = ttk.LabelFrame(parent, text=t("search_filters"), padding="10")
         filter_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         filter_frame.columnconfigure(1, weight=1)
         
         # Name filter
-        ttk.Label(filter_frame, text=self.t("name")).grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        ttk.Label(filter_frame, text=t("name")).grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
         self.name_filter = ttk.Entry(filter_frame, width=40)
         self.name_filter.grid(row=0, column=1, columnspan=5, sticky=(tk.W, tk.E), pady=(0, 5), padx=(0, 5))
         
         # Extension filter
-        ttk.Label(filter_frame, text=self.t("extension")).grid(row=1, column=0, sticky=tk.W, pady=(0, 5))
+        ttk.Label(filter_frame, text=t("extension")).grid(row=1, column=0, sticky=tk.W, pady=(0, 5))
         self.ext_filter = ttk.Entry(filter_frame, width=40)
         self.ext_filter.grid(row=1, column=1, columnspan=5, sticky=(tk.W, tk.E), pady=(0, 5), padx=(0, 5))
         
         # Tip label
-        tip_label = ttk.Label(filter_frame, text=self.t("tip"), 
+        tip_label = ttk.Label(filter_frame, text=t("tip"), 
                              foreground="gray", font=('', 8))
         tip_label.grid(row=2, column=0, columnspan=6, sticky=tk.W, pady=(0, 5))
         
         # Search directory
-        ttk.Label(filter_frame, text=self.t("search_directory")).grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
+        ttk.Label(filter_frame, text=t("search_directory")).grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
         self.search_dir = ttk.Entry(filter_frame, width=60)
         self.search_dir.grid(row=3, column=1, columnspan=4, sticky=(tk.W, tk.E), pady=(10, 0), padx=(0, 5))
         
-        self.browse_btn = ttk.Button(filter_frame, text=self.t("browse"), command=self.browse_directory)
+        self.browse_btn = ttk.Button(filter_frame, text=t("browse"), command=self.browse_directory)
         self.browse_btn.grid(row=3, column=5, pady=(10, 0), sticky=tk.W)
 
         # Path filter (Moved below Search Directory)
-        ttk.Label(filter_frame, text=self.t("path_contains")).grid(row=4, column=0, sticky=tk.W, pady=(5, 0))
+        ttk.Label(filter_frame, text=t("path_contains")).grid(row=4, column=0, sticky=tk.W, pady=(5, 0))
         self.path_filter = ttk.Entry(filter_frame, width=30)
         self.path_filter.grid(row=4, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0), padx=(0, 5))
 
         # Exclude Path filter (New)
-        ttk.Label(filter_frame, text=self.t("exclude_path")).grid(row=4, column=3, sticky=tk.W, pady=(5, 0), padx=(10, 5))
+        ttk.Label(filter_frame, text=t("exclude_path")).grid(row=4, column=3, sticky=tk.W, pady=(5, 0), padx=(10, 5))
         self.exclude_path_filter = ttk.Entry(filter_frame, width=30)
         self.exclude_path_filter.grid(row=4, column=4, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0), padx=(0, 5))
         
@@ -1525,7 +1969,7 @@ class FileSearchApp:
         self.exclude_path_filter.bind('<KeyRelease>', lambda e: self.schedule_save_settings())
         self.search_dir.bind('<KeyRelease>', lambda e: self.schedule_save_settings())
         
-        self.browse_btn = ttk.Button(filter_frame, text=self.t("browse"), command=self.browse_directory)
+        self.browse_btn = ttk.Button(filter_frame, text=t("browse"), command=self.browse_directory)
         self.browse_btn.grid(row=3, column=5, pady=(10, 0), sticky=tk.W)
         
         # Options
@@ -1533,17 +1977,18 @@ class FileSearchApp:
         options_frame.grid(row=5, column=0, columnspan=6, sticky=tk.W, pady=(5, 0))
         
         self.recursive_var = tk.BooleanVar(value=True)
-        recursive_check = ttk.Checkbutton(options_frame, text=self.t("include_subdirs"), variable=self.recursive_var, command=self.save_settings, style="Red.TCheckbutton")
+        recursive_check = ttk.Checkbutton(options_frame, text=t("include_subdirs"), variable=self.recursive_var, command=self.save_settings, style="Red.TCheckbutton")
         recursive_check.pack(side=tk.LEFT, padx=(0, 20))
         
         self.regex_var = tk.BooleanVar(value=False)
-        regex_check = ttk.Checkbutton(options_frame, text=self.t("use_regex"), variable=self.regex_var, command=self.toggle_regex_tip, style="Red.TCheckbutton")
+        regex_check = ttk.Checkbutton(options_frame, text=t("use_regex"), variable=self.regex_var, command=self.toggle_regex_tip, style="Red.TCheckbutton")
         regex_check.pack(side=tk.LEFT)
         
         # Regex tip (initially hidden)
-        self.regex_tip = ttk.Label(filter_frame, text=self.t("regex_tip"), 
+        self.regex_tip = ttk.Label(filter_frame, text=t("regex_tip"), 
                              foreground="gray", font=('', 8))
         # Don't grid it initially - will be shown by toggle_regex_tip if needed
+        self.regex_tip_shown = False
     
     def create_control_section(self, parent):
         """Create control buttons section"""
@@ -1606,6 +2051,15 @@ class FileSearchApp:
         # Add startup button if it exists (Windows only)
         if sys.platform == 'win32' and hasattr(self, 'startup_btn'):
             self.control_buttons.append(self.startup_btn)
+        
+        # Tk paths of everything locked during a search (all ttk, so one 'state' call each)
+        self.search_controls = tuple(widget._w for widget in self.control_buttons + [
+            self.name_filter,
+            self.ext_filter,
+            self.path_filter,
+            self.search_dir,
+            self.browse_btn
+        ])
     
     def create_results_section(self, parent):
         """Create results display section with treeview"""
@@ -1632,11 +2086,16 @@ class FileSearchApp:
             tree_frame,
             columns=("type", "modified", "size", "path"),
             show="tree headings",
-            yscrollcommand=vsb.set,
             xscrollcommand=hsb.set,
             height=20
         )
         
+        def on_yscroll(first, last):
+            vsb.set(first, last)
+            self._hover_band = None  # Rows moved under the pointer
+        
+        self.tree.configure(yscrollcommand=on_yscroll)
+        
         vsb.config(command=self.tree.yview)
         hsb.config(command=self.tree.xview)
         
@@ -1665,6 +2124,7 @@ class FileSearchApp:
         self.tree.bind("<Motion>", self.on_tree_hover)
         self.tree.bind("<Leave>", self.on_tree_leave)
         self.last_hover_item = None
+        self._hover_band = None  # (top, bottom) pixel rows of last_hover_item
         
         # Add sorting
         self.tree.heading("#0", text=self.t("name").rstrip(':'), command=lambda: self.sort_column("#0", False))
@@ -1698,6 +2158,11 @@ class FileSearchApp:
     
     def on_tree_hover(self, event):
         """Handle mouse hover over tree items"""
+        # Still inside the highlighted row: nothing to ask Tk
+        band = self._hover_band
+        if band and band[0] <= event.y < band[1]:
+            return
+        
         item = self.tree.identify_row(event.y)
         
         if item != self.last_hover_item:
@@ -1710,24 +2175,26 @@ class FileSearchApp:
                 self.update_item_tags(item, hover=True)
             
             self.last_hover_item = item
+        
+        bbox = self.tree.bbox(item) if item else None
+        self._hover_band = (bbox[1], bbox[1] + bbox[3]) if bbox else None
     
     def on_tree_leave(self, event):
         """Handle mouse leaving tree widget"""
         if self.last_hover_item:
             self.update_item_tags(self.last_hover_item, hover=False)
             self.last_hover_item = None
+        self._hover_band = None
     
     def update_item_tags(self, item, hover=False):
         """Update tags for an item based on its state"""
         if not item:
             return
         
-        # Get item index for zebra striping
-        all_items = self.tree.get_children()
-        try:
-            index = all_items.index(item)
-        except ValueError:
-            index = 0
+        # Get item index for zebra striping (row positions are rebuilt only after the order changes)
+        if self._item_index is None:
+            self._item_index = {item_id: index for index, item_id in enumerate(self.tree.get_children())}
+        index = self._item_index.get(item, 0)
         
         is_even = index % 2 == 0
         is_checked = self.checked_items.get(item, False)
@@ -1746,38 +2213,56 @@ class FileSearchApp:
         
         self.tree.item(item, tags=tags)
     
+    def apply_item_updates(self, updates):
+        """Apply (item_id, text, tag) updates to the tree in a single Tcl call"""
+        if not updates:
+            return
+        
+        flat = []
+        for item_id, text, tag in updates:
+            flat.extend((item_id, text, tag))
+        
+        self.tree.tk.call(
+            'foreach', ('item_id', 'text', 'tag'), tuple(flat),
+            f'{self.tree._w} item $item_id -text $text -tags $tag'
+        )
+    
     def sort_column(self, col, reverse):
         """Sort treeview by column"""
-        items = [(self.tree.set(item, col) if col != "#0" else self.tree.item(item, "text"), item) 
-                 for item in self.tree.get_children("")]
-        
+        # Keys come from the Python-side row data, never from per-cell Tcl reads
+        sort_keys = self._sort_keys
+        item_paths = self._item_paths
         if col == "size":
-            def size_to_bytes(size_str):
-                if not size_str:
-                    return 0
-                parts = size_str.split()
-                if len(parts) != 2:
-                    return 0
-                value, unit = parts
-                try:
-                    value = float(value)
-                    multipliers = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
-                    return value * multipliers.get(unit, 1)
-                except:
-                    return 0
-            items = [(size_to_bytes(val), item) for val, item in items]
+            items = [(sort_keys[item][0], item) for item in sort_keys]
         elif col == "modified":
-            pass
+            items = [(sort_keys[item][1], item) for item in sort_keys]
+        elif col == "type":
+            items = [(sort_keys[item][2].lower(), item) for item in sort_keys]
+        elif col == "path":
+            items = [(path.lower(), item) for item, path in item_paths.items()]
         else:
-            items = [(val.lower() if isinstance(val, str) else val, item) for val, item in items]
+            items = [(os.path.basename(path).lower(), item) for item, path in item_paths.items()]
         
         items.sort(reverse=reverse)
+        self._item_index = {item: index for index, (val, item) in enumerate(items)}
         
-        # Move items and reapply zebra striping
+        # Move items and reapply zebra striping, all in one Tcl call
+        checked_items = self.checked_items
+        flat = []
         for index, (val, item) in enumerate(items):
-            self.tree.move(item, "", index)
-            # Reapply zebra striping after sort
-            self.update_item_tags(item, hover=False)
+            if checked_items.get(item, False):
+                tag = 'checked'
+            else:
+                tag = 'evenrow' if index % 2 == 0 else 'oddrow'
+            flat.extend((item, tag))
+        
+        if flat:
+            self.tree.tk.call(
+                'foreach', ('item_id', 'tag'), tuple(flat),
+                f'{self.tree._w} move $item_id {{}} end; {self.tree._w} item $item_id -tags $tag'
+            )
+        self.last_hover_item = None  # Hover highlight was replaced above
+        self._hover_band = None
         
         new_reverse = not reverse
         self.tree.heading(col, command=lambda: self.sort_column(col, new_reverse))
@@ -1788,18 +2273,8 @@ class FileSearchApp:
         self.tree.heading(col, text=base_text + arrow)
     
     def create_check_images(self):
-        """Create toggle-style checkbox images"""
-        # Toggle switch style icons (more modern)
-        if self.dark_mode:
-            self.check_images = {
-                'checked': '🟦',    # Blue square for checked
-                'unchecked': '⬜'   # White square for unchecked
-            }
-        else:
-            self.check_images = {
-                'checked': '🟦',    # Blue square for checked
-                'unchecked': '⬜'   # White square for unchecked
-            }
+        """Select the toggle-style checkbox images for the current theme"""
+        self.check_images = self.CHECK_IMAGES["dark" if self.dark_mode else "light"]
     
     def create_status_bar(self, parent):
         """Create status bar"""
@@ -1821,27 +2296,11 @@ class FileSearchApp:
     
     def disable_controls(self):
         """Disable all controls during search"""
-        for button in self.control_buttons:
-            button.config(state='disabled')
-        
-        # Disable filter inputs
-        self.name_filter.config(state='disabled')
-        self.ext_filter.config(state='disabled')
-        self.path_filter.config(state='disabled')
-        self.search_dir.config(state='disabled')
-        self.browse_btn.config(state='disabled')
+        self.root.tk.call('foreach', 'widget', self.search_controls, '$widget state disabled')
     
     def enable_controls(self):
         """Enable all controls after search"""
-        for button in self.control_buttons:
-            button.config(state='normal')
-        
-        # Enable filter inputs
-        self.name_filter.config(state='normal')
-        self.ext_filter.config(state='normal')
-        self.path_filter.config(state='normal')
-        self.search_dir.config(state='normal')
-        self.browse_btn.config(state='normal')
+        self.root.tk.call('foreach', 'widget', self.search_controls, '$widget state !disabled')
     
     def start_search(self):
         """Start file search in background thread"""
@@ -1850,7 +2309,7 @@ class FileSearchApp:
             return
         
         # Initialize search filter first
-        search_filter = SearchFilter(
+        search_filter = get_search_filter(
             self.name_filter.get(),
             self.ext_filter.get(),
             self.path_filter.get(),
@@ -1908,7 +2367,7 @@ class FileSearchApp:
     def search_index(self, search_filter: SearchFilter, search_dir: str = None):
         """Search using indexer with cancellation support"""
         try:
-            self.root.after(0, self.update_status, self.t("searching"))
+            self.update_status(self.t("searching"))
             
             # Track total results
             self.total_found = 0
@@ -1919,14 +2378,12 @@ class FileSearchApp:
                 
                 # Update total count
                 self.total_found += len(batch)
-                count = self.total_found
                 
                 # Add to internal list for export
                 self.search_results.extend(batch)
                 
                 # Schedule UI update
-                self.root.after(0, self.add_results_batch, batch)
-                self.root.after(0, self.results_label.config, {"text": self.t("results") + f" {count}"})
+                self.queue_results(batch)
             
             # Get results with cancellation check and callback
             self.indexer.search(
@@ -1937,13 +2394,13 @@ class FileSearchApp:
             )
             
             if self.search_cancelled:
-                self.root.after(0, self.update_status, "Search cancelled")
+                self.update_status("Search cancelled")
                 return
             
             if not self.search_cancelled:
                 count = self.total_found
                 self.root.after(0, self.results_label.config, {"text": self.t("results") + f" {count}"})
-                self.root.after(0, self.update_status, self.t("found_files").format(count))
+                self.update_status(self.t("found_files").format(count))
             
         except Exception as e:
             self.root.after(0, messagebox.showerror, self.t("error"), str(e))
@@ -1955,12 +2412,25 @@ class FileSearchApp:
 
     def show_index_manager(self):
         """Show index management dialog with enhanced features"""
-        # Check if Index Manager is already open
-        if self.index_manager_window is not None and self.index_manager_window.winfo_exists():
-            # Bring existing window to front
-            self.index_manager_window.lift()
-            self.index_manager_window.focus_force()
-            return
+        # Check if Index Manager is already open or hidden
+        manager = self.index_manager_window
+        if manager is not None and manager.winfo_exists():
+            if manager.state() != 'withdrawn':
+                # Bring existing window to front
+                manager.lift()
+                manager.focus_force()
+                return
+            
+            if self.index_manager_key == (self.dark_mode, self.current_language):
+                # Reuse the hidden window; only the folder list may be out of date
+                self.index_manager_refresh()
+                manager.deiconify()
+                manager.lift()
+                manager.focus_force()
+                return
+            
+            # Theme or language changed since it was built
+            manager.destroy()
         
         manager = tk.Toplevel(self.root)
         manager.title(self.t("index_manager_title"))
@@ -1969,13 +2439,10 @@ class FileSearchApp:
         
         # Store reference to window
         self.index_manager_window = manager
+        self.index_manager_key = (self.dark_mode, self.current_language)
         
-        # Clear reference when window is closed
-        def on_close():
-            self.index_manager_window = None
-            manager.destroy()
-        
-        manager.protocol("WM_DELETE_WINDOW", on_close)
+        # Hide instead of destroying so the next open skips the rebuild
+        manager.protocol("WM_DELETE_WINDOW", manager.withdraw)
         
         # Apply theme
         theme = self.themes["dark" if self.dark_mode else "light"]
@@ -2015,7 +2482,7 @@ class FileSearchApp:
         folder_tree.config(yscrollcommand=scrollbar.set)
         
         # Apply theme to treeview
-        style = ttk.Style()
+        style = self.style
         style.configure("IndexManager.Treeview",
                        background=theme["entry_bg"],
                        foreground=theme["entry_fg"],
@@ -2091,6 +2558,7 @@ class FileSearchApp:
                 pass
             
         refresh_list()
+        self.index_manager_refresh = refresh_list
         
         # Button frame
         btn_frame = ttk.Frame(main_container)
@@ -2126,8 +2594,10 @@ class FileSearchApp:
                     
                     def run_single_update_for_new_folder():
                         try:
+                            progress_text = self.t("indexing_progress")
+                            
                             def progress(count):
-                                self.root.after(0, lambda: safe_config(status_label, text=self.t("indexing_progress").format(count)))
+                                self.root.after(0, lambda: safe_config(status_label, text=progress_text.format(count)))
                                     
                             self.indexer.update_folder_index(path, progress_callback=progress)
                             self.root.after(0, update_status_label)
@@ -2198,8 +2668,10 @@ class FileSearchApp:
             
             def run_single_update():
                 try:
+                    progress_text = self.t("indexing_progress")
+                    
                     def progress(count):
-                        self.root.after(0, lambda: safe_config(status_label, text=self.t("indexing_progress").format(count)))
+                        self.root.after(0, lambda: safe_config(status_label, text=progress_text.format(count)))
                             
                     self.indexer.update_folder_index(path, progress_callback=progress)
                     self.root.after(0, update_status_label)
@@ -2216,8 +2688,10 @@ class FileSearchApp:
             
             def run_update():
                 try:
+                    progress_text = self.t("indexing_progress")
+                    
                     def progress(count):
-                        self.root.after(0, lambda: safe_config(status_label, text=self.t("indexing_progress").format(count)))
+                        self.root.after(0, lambda: safe_config(status_label, text=progress_text.format(count)))
                             
                     self.indexer.update_index(progress_callback=progress)
                     self.root.after(0, update_status_label)
@@ -2239,7 +2713,6 @@ class FileSearchApp:
                         if sys.platform == 'win32':
                             os.startfile(path)
                         else:
-                            import subprocess
                             subprocess.Popen(['xdg-open', path])
                     except Exception as e:
                         messagebox.showerror(self.t("error"), str(e))
@@ -2298,10 +2771,10 @@ class FileSearchApp:
             def run_update():
                 try:
                     self.indexer.update_index()
-                    self.root.after(0, self.update_status, self.t("index_complete"))
+                    self.update_status(self.t("index_complete"))
                 except Exception as e:
                     self.root.after(0, messagebox.showerror, self.t("error"), str(e))
-                    self.root.after(0, self.update_status, self.t("error"))
+                    self.update_status(self.t("error"))
             
             threading.Thread(target=run_update, daemon=True).start()
     
@@ -2313,51 +2786,89 @@ class FileSearchApp:
     def search_files(self, directory: str, search_filter: SearchFilter):
         """Search files in directory"""
         try:
-            self.root.after(0, self.update_status, self.t("searching"))
+            self.update_status(self.t("searching"))
             
-            file_count = 0
-            batch = []
             batch_size = 50  # Add results in batches to reduce UI updates
+            recursive = self.recursive_var.get()
+            matches = search_filter.matches
+            dir_queue = queue.Queue()
             
-            for root, dirs, files in os.walk(directory):
-                if self.search_cancelled:
-                    break
-                
-                for file in files:
-                    if self.search_cancelled:
+            def scan_dir(root, batch):
+                # Files are matched on name/path first and only stat'ed when they pass the filter
+                try:
+                    with os.scandir(root) as entries:
+                        for entry in entries:
+                            if self.search_cancelled:
+                                break
+                            
+                            try:
+                                is_dir = entry.is_dir()
+                            except OSError:
+                                is_dir = False
+                            
+                            if is_dir:
+                                # Like os.walk, don't descend into symlinked folders
+                                if recursive and not entry.is_symlink():
+                                    dir_queue.put(entry.path)
+                                continue
+                            
+                            try:
+                                file_item = FileItem(entry.path, 0, 0)
+                                if not matches(file_item):
+                                    continue
+                                
+                                try:
+                                    stat = entry.stat()
+                                    file_item.size = stat.st_size
+                                    file_item.mtime = stat.st_mtime
+                                except OSError:
+                                    file_item.mtime = time.time()
+                                file_item.is_dir = False
+                                batch.append(file_item)
+                            except Exception as e:
+                                pass
+                except OSError:
+                    pass
+            
+            def walker():
+                batch = []
+                while True:
+                    root = dir_queue.get()
+                    if root is None:
                         break
-                    
                     try:
-                        file_path = os.path.join(root, file)
-                        file_item = FileItem(file_path)
-                        
-                        if search_filter.matches(file_item):
-                            self.search_results.append(file_item)
-                            batch.append(file_item)
-                            file_count += 1
+                        if not self.search_cancelled:
+                            scan_dir(root, batch)
                             
                             # Add results in batches for better performance
                             if len(batch) >= batch_size:
-                                # Schedule batch update
-                                items_to_add = batch.copy()
-                                self.root.after(0, self.add_results_batch, items_to_add)
-                                batch.clear()
-                                
-                                # Update count
-                                self.root.after(0, self.results_label.config, {"text": self.t("results") + f" {file_count}"})
-                    except Exception as e:
-                        pass
+                                self.search_results.extend(batch)
+                                self.queue_results(batch)
+                                batch = []
+                    finally:
+                        dir_queue.task_done()
                 
-                if not self.recursive_var.get():
-                    break
+                # Add remaining items
+                if batch:
+                    self.search_results.extend(batch)
+                    self.queue_results(batch)
+            
+            # Several walkers overlap directory I/O; subfolders are fed back into the shared queue
+            worker_count = min(8, os.cpu_count() or 1) if recursive else 1
+            dir_queue.put(directory)
+            workers = [threading.Thread(target=walker, daemon=True) for _ in range(worker_count)]
+            for worker in workers:
+                worker.start()
             
-            # Add remaining items
-            if batch:
-                self.root.after(0, self.add_results_batch, batch)
+            dir_queue.join()
+            for _ in workers:
+                dir_queue.put(None)
+            for worker in workers:
+                worker.join()
             
             count = len(self.search_results)
             self.root.after(0, self.results_label.config, {"text": self.t("results") + f" {count}"})
-            self.root.after(0, self.update_status, self.t("found_files").format(count))
+            self.update_status(self.t("found_files").format(count))
             
         except Exception as e:
             self.root.after(0, messagebox.showerror, self.t("error"), str(e))
@@ -2367,30 +2878,77 @@ class FileSearchApp:
             self.root.after(0, self.search_btn.grid)
             self.root.after(0, self.enable_controls)
     
+    def queue_results(self, batch):
+        """Hand a result batch from a search thread to the UI; batches arriving together are added in one flush"""
+        with self._pending_lock:
+            self._pending_batches.append(batch)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after(30, self.flush_results)
+    
+    def flush_results(self):
+        """Add queued result batches to the tree and update the count once"""
+        items = []
+        with self._pending_lock:
+            # Take whole batches up to MAX_FLUSH_ROWS so a flood of results can't stall the event loop
+            batches = self._pending_batches
+            taken = 0
+            while taken < len(batches) and len(items) < MAX_FLUSH_ROWS:
+                items.extend(batches[taken])
+                taken += 1
+            self._pending_batches = batches[taken:]
+            more = bool(self._pending_batches)
+            self._flush_scheduled = more
+        
+        if more:
+            # Rescheduled from the main thread; workers keep appending without touching Tk
+            self.root.after(30, self.flush_results)
+        if items:
+            self.add_results_batch(items)
+            self.update_results_label()
+    
     def add_results_batch(self, items):
         """Add multiple results to tree at once"""
-        for file_item in items:
-            self.add_result_to_tree(file_item)
+        if not items:
+            return
+        
+        checkbox = self.check_images['unchecked']
+        start = self._results_count
+        
+        rows = []
+        for index, file_item in enumerate(items, start):
+            rows.extend((
+                f"{checkbox} {file_item.name}",
+                (
+                    file_item.get_type(),
+                    file_item.modified.strftime("%Y-%m-%d %H:%M:%S"),
+                    file_item.get_size_str(),
+                    file_item.path
+                ),
+                'evenrow' if index % 2 == 0 else 'oddrow',
+            ))
+        
+        # One Tcl call for the whole batch instead of one tree.insert() per row
+        item_ids = self.tree.tk.splitlist(
+            self.tree.tk.call('apply', TREE_BULK_INSERT, self.tree._w, tuple(rows))
+        )
+        
+        checked_items = self.checked_items
+        item_paths = self._item_paths
+        item_index = self._item_index
+        sort_keys = self._sort_keys
+        for index, (item_id, file_item) in enumerate(zip(item_ids, items), start):
+            checked_items[item_id] = False
+            item_paths[item_id] = file_item.path
+            sort_keys[item_id] = (file_item.size, file_item.mtime, file_item.get_type())
+            if item_index is not None:
+                item_index[item_id] = index
+        self._results_count = start + len(item_ids)
     
     def add_result_to_tree(self, file_item: FileItem):
         """Add search result to tree with zebra striping"""
-        checkbox = self.check_images['unchecked']
-        
-        # Get current number of items for zebra striping
-        current_count = len(self.tree.get_children())
-        is_even = current_count % 2 == 0
-        row_tag = 'evenrow' if is_even else 'oddrow'
-        
-        item_id = self.tree.insert("", "end", 
-                                   text=f"{checkbox} {file_item.name}",
-                                   values=(
-                                       file_item.get_type(),
-                                       file_item.modified.strftime("%Y-%m-%d %H:%M:%S"),
-                                       file_item.get_size_str(),
-                                       file_item.path
-                                   ),
-                                   tags=(row_tag,))
-        self.checked_items[item_id] = False
+        self.add_results_batch((file_item,))
     
     def on_double_click(self, event):
         """Handle double click to execute file"""
@@ -2416,28 +2974,19 @@ class FileSearchApp:
         if selection:
             self.toggle_check_item(selection[0])
     
+    def get_item_text(self, item_id, checked):
+        """Tree label for a row, built from its stored path instead of the current cell text"""
+        checkbox = self.check_images['checked'] if checked else self.check_images['unchecked']
+        return f"{checkbox} {os.path.basename(self._item_paths[item_id])}"
+    
     def toggle_check_item(self, item_id):
         """Toggle checkbox state with visual feedback"""
         current_state = self.checked_items.get(item_id, False)
         new_state = not current_state
         self.checked_items[item_id] = new_state
         
-        # Update checkbox icon - properly handle emoji characters
-        current_text = self.tree.item(item_id, "text")
-        
-        # Remove old checkbox emoji (search for both types)
-        for emoji in ['🟦', '⬜', '☑', '☐']:
-            if current_text.startswith(emoji):
-                current_text = current_text[len(emoji):].lstrip()
-                break
-        
-        # Add new checkbox emoji
-        if new_state:
-            new_text = self.check_images['checked'] + ' ' + current_text
-        else:
-            new_text = self.check_images['unchecked'] + ' ' + current_text
-        
-        self.tree.item(item_id, text=new_text)
+        # Update checkbox icon
+        self.tree.item(item_id, text=self.get_item_text(item_id, new_state))
         
         # Update item tags for visual feedback
         self.update_item_tags(item_id, hover=False)
@@ -2457,26 +3006,14 @@ class FileSearchApp:
         batch_size = 100
         for i in range(0, total, batch_size):
             batch = items[i:i+batch_size]
+            updates = []
             for item_id in batch:
                 if not self.checked_items.get(item_id, False):
                     # Update state without full UI refresh
                     self.checked_items[item_id] = True
-                    current_text = self.tree.item(item_id, "text")
-                    
-                    # Remove old checkbox
-                    for emoji in ['🟦', '⬜', '☑', '☐']:
-                        if current_text.startswith(emoji):
-                            current_text = current_text[len(emoji):].lstrip()
-                            break
-                    
-                    # Add checked icon
-                    new_text = self.check_images['checked'] + ' ' + current_text
-                    self.tree.item(item_id, text=new_text)
-                    
-                    # Update visual style
-                    all_items = self.tree.get_children()
-                    index = all_items.index(item_id)
-                    self.tree.item(item_id, tags=('checked',))
+                    updates.append((item_id, self.get_item_text(item_id, True), 'checked'))
+            
+            self.apply_item_updates(updates)
             
             # Allow UI to update periodically
             if i % (batch_size * 5) == 0:
@@ -2487,7 +3024,7 @@ class FileSearchApp:
         self.update_status(f"Selected {total} items")
     
     def select_none(self):
-        """Deselect all checkboxes with batch processing"""
+        """Deselect all checkboxes in chunks scheduled on the event loop"""
         items = self.tree.get_children()
         total = len(items)
         
@@ -2497,36 +3034,34 @@ class FileSearchApp:
         # Disable UI updates temporarily
         self.tree.configure(takefocus=0)
         
-        # Process in batches
         batch_size = 100
-        for i in range(0, total, batch_size):
-            batch = items[i:i+batch_size]
-            for item_id in batch:
+        
+        def process_chunk(start):
+            end = min(start + batch_size, total)
+            updates = []
+            for index in range(start, end):
+                item_id = items[index]
+                # Items removed since the first chunk are no longer tracked
                 if self.checked_items.get(item_id, False):
                     # Update state
                     self.checked_items[item_id] = False
-                    current_text = self.tree.item(item_id, "text")
-                    
-                    # Remove old checkbox
-                    for emoji in ['🟦', '⬜', '☑', '☐']:
-                        if current_text.startswith(emoji):
-                            current_text = current_text[len(emoji):].lstrip()
-                            break
-                    
-                    # Add unchecked icon
-                    new_text = self.check_images['unchecked'] + ' ' + current_text
-                    self.tree.item(item_id, text=new_text)
                     
-                    # Update visual style
-                    self.update_item_tags(item_id, hover=False)
+                    # Add unchecked icon and restore zebra striping
+                    new_text = self.get_item_text(item_id, False)
+                    row_tag = 'evenrow' if index % 2 == 0 else 'oddrow'
+                    updates.append((item_id, new_text, row_tag))
             
-            # Allow UI to update periodically
-            if i % (batch_size * 5) == 0:
-                self.root.update_idletasks()
+            self.apply_item_updates(updates)
+            
+            if end < total:
+                # Yield to the event loop instead of forcing a redraw
+                self.root.after(1, process_chunk, end)
+            else:
+                # Re-enable UI
+                self.tree.configure(takefocus=1)
+                self.update_status(f"Deselected {total} items")
         
-        # Re-enable UI
-        self.tree.configure(takefocus=1)
-        self.update_status(f"Deselected {total} items")
+        process_chunk(0)
     
     def show_context_menu(self, event):
         """Show right-click context menu"""
@@ -2538,11 +3073,7 @@ class FileSearchApp:
         file_path = self.tree.item(item_id, "values")[3]
         
         # Get checked files
-        checked_files = [
-            self.tree.item(item, "values")[3]
-            for item, checked in self.checked_items.items()
-            if checked
-        ]
+        checked_files = self.get_checked_paths()
         has_checked = len(checked_files) > 0
         
         # Create context menu
@@ -2552,7 +3083,7 @@ class FileSearchApp:
         def close_then_execute(func):
             def wrapper():
                 context_menu.unpost()
-                self.root.after(10, func)
+                self.root.after_idle(func)
             return wrapper
         
         context_menu.add_command(label=self.t("open"), command=close_then_execute(lambda: self.execute_file(file_path, admin=False)))
@@ -2562,19 +3093,22 @@ class FileSearchApp:
         context_menu.add_command(label=self.t("open_location"), command=close_then_execute(lambda: self.open_file_location(file_path)))
         context_menu.add_separator()
         
+        labels = self.context_menu_labels
+        
         # Copy and Move - work with checked files if any, otherwise single file
         if has_checked:
+            checked_count = len(checked_files)
             context_menu.add_command(
-                label=f"📋 {self.t('copy_to')} ({len(checked_files)} {self.t('files')})", 
+                label=labels["copy_to_count"] % checked_count, 
                 command=close_then_execute(lambda: self.copy_files_to(checked_files))
             )
             context_menu.add_command(
-                label=f"📦 {self.t('move_to')} ({len(checked_files)} {self.t('files')})", 
+                label=labels["move_to_count"] % checked_count, 
                 command=close_then_execute(lambda: self.move_files_to(checked_files))
             )
         else:
-            context_menu.add_command(label="📋 " + self.t("copy_to"), command=close_then_execute(lambda: self.copy_files_to([file_path])))
-            context_menu.add_command(label="📦 " + self.t("move_to"), command=close_then_execute(lambda: self.move_files_to([file_path])))
+            context_menu.add_command(label=labels["copy_to"], command=close_then_execute(lambda: self.copy_files_to([file_path])))
+            context_menu.add_command(label=labels["move_to"], command=close_then_execute(lambda: self.move_files_to([file_path])))
         context_menu.add_separator()
         
         context_menu.add_command(label=self.t("rename"), command=close_then_execute(lambda: self.rename_file(file_path)))
@@ -2585,11 +3119,11 @@ class FileSearchApp:
         if sys.platform == 'win32':
             if has_checked:
                 context_menu.add_command(
-                    label=f"🚀 {self.t('add_to_startup')} ({len(checked_files)} {self.t('files')})", 
+                    label=labels["add_to_startup_count"] % checked_count, 
                     command=close_then_execute(lambda: self.add_files_to_startup(checked_files))
                 )
             else:
-                context_menu.add_command(label="🚀 " + self.t("add_to_startup"), command=close_then_execute(lambda: self.add_files_to_startup([file_path])))
+                context_menu.add_command(label=labels["add_to_startup"], command=close_then_execute(lambda: self.add_files_to_startup([file_path])))
         
         context_menu.add_separator()
         context_menu.add_command(label=self.t("copy_path"), command=close_then_execute(lambda: self.copy_path(file_path)))
@@ -2601,14 +3135,16 @@ class FileSearchApp:
             context_menu.grab_release()
     
     def execute_file(self, file_path: str, admin: bool = False):
-        """Execute a file"""
+        """Execute a file on a background thread to keep the UI responsive"""
+        threading.Thread(target=self._execute_file_worker, args=(file_path, admin), daemon=True).start()
+    
+    def _execute_file_worker(self, file_path: str, admin: bool):
+        """Execute a file (runs off the Tk thread; UI updates go through root.after)"""
         try:
             file_ext = os.path.splitext(file_path)[1].lower()
             
             if admin:
                 if sys.platform == 'win32':
-                    import ctypes
-                    
                     file_path = os.path.abspath(file_path)
                     
                     print(f"[DEBUG] Attempting to run as admin: {file_path}")
@@ -2651,14 +3187,12 @@ class FileSearchApp:
                         print(f"[DEBUG] Successfully executed as admin")
                     except Exception as e:
                         print(f"[DEBUG] Admin execution failed: {e}")
-                        messagebox.showerror(self.t("execution_error"), str(e))
+                        self.root.after(0, messagebox.showerror, self.t("execution_error"), str(e))
                         return
                 else:
                     subprocess.Popen(['sudo', 'xdg-open', file_path])
             else:
                 if sys.platform == 'win32':
-                    import ctypes
-                    import subprocess
                     file_path = os.path.abspath(file_path)
                     
                     # Special handling for batch files and console applications
@@ -2732,15 +3266,12 @@ class FileSearchApp:
             import traceback
             error_detail = traceback.format_exc()
             print(error_detail)
-            messagebox.showerror(self.t("execution_error"), f"Failed to execute file:\n{str(e)}\n\nFile: {file_path}")
+            self.root.after(0, messagebox.showerror, self.t("execution_error"), f"Failed to execute file:\n{str(e)}\n\nFile: {file_path}")
     
     def open_with(self, file_path: str):
         """Open file with dialog"""
         try:
             if sys.platform == 'win32':
-                import ctypes
-                import time
-                
                 # Ensure absolute path
                 file_path = os.path.abspath(file_path)
                 
@@ -2749,83 +3280,26 @@ class FileSearchApp:
                     messagebox.showerror(self.t("error"), f"File not found:\n{file_path}")
                     return
                 
-                # Method 1: Use rundll32 with process detachment (most reliable)
-                try:
-                    # Create a detached process that won't be terminated when parent exits
-                    # DETACHED_PROCESS = 0x00000008
-                    # CREATE_NEW_PROCESS_GROUP = 0x00000200
-                    DETACHED_PROCESS = 0x00000008
-                    CREATE_NEW_PROCESS_GROUP = 0x00000200
-                    
-                    # Use both flags for maximum stability
-                    creation_flags = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
-                    
-                    # Start the process
-                    process = subprocess.Popen(
-                        ['rundll32.exe', 'shell32.dll,OpenAs_RunDLL', file_path],
-                        creationflags=creation_flags,
-                        shell=False,
-                        stdin=subprocess.DEVNULL,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    
-                    # Don't wait for the process - let it run independently
-                    self.update_status(f"Opening 'Open With' dialog for: {os.path.basename(file_path)}")
-                    return
-                    
-                except Exception as e1:
-                    print(f"Method 1 (rundll32 detached) failed: {e1}")
-                
-                # Method 2: Use Windows API with proper verb
-                try:
-                    # Try "open" verb which sometimes shows the Open With dialog
-                    # for files without association
-                    ret = ctypes.windll.shell32.ShellExecuteW(
-                        None,
-                        None,           # Let Windows decide
-                        file_path,
-                        None,
-                        None,
-                        1
-                    )
-                    
-                    if ret > 32:
-                        self.update_status(f"Opening file: {os.path.basename(file_path)}")
-                        return
-                    
-                    print(f"ShellExecuteW failed with code: {ret}")
+                def show_dialog():
+                    # SHOpenWithDialog is modal, so keep it off the Tk thread
+                    ctypes.windll.ole32.CoInitializeEx(None, 0x2)  # COINIT_APARTMENTTHREADED
+                    try:
+                        info = OPENASINFO(file_path, None, OAIF_ALLOW_REGISTRATION | OAIF_REGISTER_EXT | OAIF_EXEC)
+                        hr = ctypes.windll.shell32.SHOpenWithDialog(None, ctypes.byref(info))
+                    finally:
+                        ctypes.windll.ole32.CoUninitialize()
                     
-                except Exception as e2:
-                    print(f"Method 2 (ShellExecuteW) failed: {e2}")
+                    if hr < 0 and hr != HRESULT_ERROR_CANCELLED:
+                        print(f"SHOpenWithDialog failed with HRESULT: {hr & 0xFFFFFFFF:#010x}")
+                        self.root.after(
+                            0, messagebox.showerror, self.t("error"),
+                            f"Failed to open 'Open With' dialog.\n\n"
+                            f"File: {file_path}\n\n"
+                            f"Try right-clicking the file in Windows Explorer instead."
+                        )
                 
-                # Method 3: Use explorer.exe to open Open With dialog
-                try:
-                    # This is a more modern approach
-                    # Use explorer.exe with the file path
-                    process = subprocess.Popen(
-                        ['cmd', '/c', 'start', '', '/wait', 'rundll32.exe', 
-                         'shell32.dll,OpenAs_RunDLL', file_path],
-                        creationflags=subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS,
-                        shell=False,
-                        stdin=subprocess.DEVNULL,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    
-                    self.update_status(f"Opening 'Open With' dialog for: {os.path.basename(file_path)}")
-                    return
-                    
-                except Exception as e3:
-                    print(f"Method 3 (cmd start) failed: {e3}")
-                
-                # If all methods fail, show error
-                messagebox.showerror(
-                    self.t("error"), 
-                    f"Failed to open 'Open With' dialog.\n\n"
-                    f"File: {file_path}\n\n"
-                    f"Try right-clicking the file in Windows Explorer instead."
-                )
+                threading.Thread(target=show_dialog, daemon=True).start()
+                self.update_status(f"Opening 'Open With' dialog for: {os.path.basename(file_path)}")
                     
             else:
                 messagebox.showinfo(self.t("error"), self.t("open_with_not_supported"))
@@ -2839,7 +3313,6 @@ class FileSearchApp:
         """Open file location in explorer"""
         try:
             if sys.platform == 'win32':
-                import subprocess
                 subprocess.run(['explorer', '/select,', os.path.normpath(file_path)])
             else:
                 directory = os.path.dirname(file_path)
@@ -2848,96 +3321,126 @@ class FileSearchApp:
         except Exception as e:
             messagebox.showerror(self.t("error"), f"Failed to open location:\n{str(e)}")
     
+    def _ensure_rename_dialog(self):
+        """Build the rename dialog once; it is hidden between uses"""
+        if self._rename_dialog is not None and self._rename_dialog.winfo_exists():
+            return self._rename_dialog
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.transient(self.root)
+        
+        # Set size and position
+        dialog_width = 500
+        dialog_height = 150
+        x = (dialog.winfo_screenwidth() // 2) - (dialog_width // 2)
+        y = (dialog.winfo_screenheight() // 2) - (dialog_height // 2)
+        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        dialog.resizable(False, False)
+        
+        # Apply icon
+        self.set_window_icon(dialog)
+        
+        # Create frame
+        frame = ttk.Frame(dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Label
+        self._rename_label = ttk.Label(frame, font=('', 11))
+        self._rename_label.pack(anchor=tk.W, pady=(0, 10))
+        
+        # Entry
+        self._rename_entry = ttk.Entry(frame, font=('', 11), width=50)
+        self._rename_entry.pack(fill=tk.X, pady=(0, 20))
+        
+        # Set when the dialog is closed (OK or Cancel)
+        self._rename_done = tk.BooleanVar(dialog, value=False)
+        
+        def close():
+            dialog.grab_release()
+            dialog.withdraw()
+            self._rename_done.set(True)
+        
+        def on_ok(event=None):
+            self._rename_result = self._rename_entry.get()
+            close()
+        
+        def on_cancel(event=None):
+            self._rename_result = None
+            close()
+        
+        # Button frame
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack(fill=tk.X)
+        
+        self._rename_ok_btn = ttk.Button(btn_frame, command=on_ok, width=12)
+        self._rename_ok_btn.pack(side=tk.RIGHT, padx=(5, 0))
+        
+        self._rename_cancel_btn = ttk.Button(btn_frame, command=on_cancel, width=12)
+        self._rename_cancel_btn.pack(side=tk.RIGHT)
+        
+        # Bind keys (entry events propagate to the dialog)
+        dialog.bind('<Return>', on_ok)
+        dialog.bind('<Escape>', on_cancel)
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+        
+        self._rename_dialog = dialog
+        return dialog
+    
     def rename_file(self, file_path: str):
         """Rename file"""
         try:
             old_name = os.path.basename(file_path)
             
-            # Create custom dialog
-            dialog = tk.Toplevel(self.root)
-            dialog.title(self.t("rename_title"))
-            dialog.transient(self.root)
-            dialog.grab_set()
-            
-            # Set size and position
-            dialog_width = 500
-            dialog_height = 150
-            x = (dialog.winfo_screenwidth() // 2) - (dialog_width // 2)
-            y = (dialog.winfo_screenheight() // 2) - (dialog_height // 2)
-            dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-            dialog.resizable(False, False)
-            
-            # Apply icon
-            self.set_window_icon(dialog)
-            
-            # Create frame
-            frame = ttk.Frame(dialog, padding="20")
-            frame.pack(fill=tk.BOTH, expand=True)
+            dialog = self._ensure_rename_dialog()
             
-            # Label
-            label = ttk.Label(frame, text=self.t("new_name"), font=('', 11))
-            label.pack(anchor=tk.W, pady=(0, 10))
+            # Refresh texts in case the language changed since the dialog was built
+            dialog.title(self.t("rename_title"))
+            self._rename_label.config(text=self.t("new_name"))
+            self._rename_ok_btn.config(text=self.t("ok"))
+            self._rename_cancel_btn.config(text=self.t("cancel"))
             
-            # Entry
-            entry = ttk.Entry(frame, font=('', 11), width=50)
+            entry = self._rename_entry
+            entry.delete(0, tk.END)
             entry.insert(0, old_name)
-            entry.pack(fill=tk.X, pady=(0, 20))
-            entry.focus_set()
-            entry.select_range(0, tk.END)
-            
-            # Result variable
-            result = {'name': None}
+            self._rename_result = None
+            self._rename_done.set(False)
             
-            def on_ok(event=None):
-                result['name'] = entry.get()
-                dialog.destroy()
-            
-            def on_cancel(event=None):
-                dialog.destroy()
-            
-            # Button frame
-            btn_frame = ttk.Frame(frame)
-            btn_frame.pack(fill=tk.X)
-            
-            ok_btn = ttk.Button(btn_frame, text=self.t("ok"), command=on_ok, width=12)
-            ok_btn.pack(side=tk.RIGHT, padx=(5, 0))
-            
-            cancel_btn = ttk.Button(btn_frame, text=self.t("cancel"), command=on_cancel, width=12)
-            cancel_btn.pack(side=tk.RIGHT)
-            
-            # Bind keys
-            entry.bind('<Return>', on_ok)
-            entry.bind('<Escape>', on_cancel)
-            dialog.bind('<Return>', on_ok)
-            dialog.bind('<Escape>', on_cancel)
-            
-            # Focus on top
+            # Show and focus on top
+            dialog.deiconify()
             dialog.lift()
+            dialog.grab_set()
+            entry.focus_set()
+            entry.select_range(0, tk.END)
             dialog.focus_force()
             
-            # Wait for dialog
-            self.root.wait_window(dialog)
+            # Wait for OK/Cancel
+            dialog.wait_variable(self._rename_done)
             
             # Process result
-            new_name = result['name']
+            new_name = self._rename_result
             if new_name and new_name != old_name:
                 directory = os.path.dirname(file_path)
                 new_path = os.path.join(directory, new_name)
                 
-                if os.path.exists(new_path):
+                # Windows rename fails on an existing target, so no separate stat is needed
+                try:
+                    if sys.platform != 'win32' and os.path.exists(new_path):
+                        # POSIX rename silently replaces the target
+                        raise FileExistsError(new_path)
+                    os.rename(file_path, new_path)
+                except FileExistsError:
                     messagebox.showerror(self.t("error"), self.t("file_exists"))
                     return
-                
-                os.rename(file_path, new_path)
+                self._file_item_cache.pop(file_path, None)
                 self.update_status(self.t("rename_success").format(new_name))
                 
                 # Update tree item
-                for item in self.tree.get_children():
-                    if self.tree.item(item)['values'][-1] == file_path:
+                for item, item_path in self._item_paths.items():
+                    if item_path == file_path:
+                        self._item_paths[item] = new_path
                         is_checked = self.checked_items.get(item, False)
-                        checkbox = self.check_images['checked'] if is_checked else self.check_images['unchecked']
-                        new_text = f"{checkbox} {new_name}"
-                        self.tree.item(item, text=new_text)
+                        self.tree.item(item, text=self.get_item_text(item, is_checked))
                         values = list(self.tree.item(item)['values'])
                         values[-1] = new_path
                         self.tree.item(item, values=values)
@@ -2953,29 +3456,41 @@ class FileSearchApp:
                     shutil.rmtree(file_path)
                 else:
                     os.remove(file_path)
+                self._file_item_cache.pop(file_path, None)
                 
                 self.update_status(self.t("delete_success").format(os.path.basename(file_path)))
                 
                 # Remove from tree instead of full search
-                for item in self.tree.get_children():
-                    if self.tree.item(item)['values'][-1] == file_path:
+                for item, item_path in self._item_paths.items():
+                    if item_path == file_path:
                         self.tree.delete(item)
+                        self._item_index = None  # Later rows moved up
+                        self._hover_band = None
+                        self.checked_items.pop(item, None)
+                        del self._item_paths[item]
+                        self._sort_keys.pop(item, None)
+                        self._results_count -= 1
                         self.update_results_label()
                         break
         except Exception as e:
             messagebox.showerror(self.t("delete_failed"), str(e))
     
+    def _get_wscript_shell(self):
+        """Get cached WScript.Shell COM object (created on first use)"""
+        if self._wscript_shell is None:
+            import win32com.client
+            self._wscript_shell = win32com.client.Dispatch("WScript.Shell")
+        return self._wscript_shell
+    
     def create_shortcut(self, file_path: str):
         """Create shortcut"""
         try:
             if sys.platform == 'win32':
-                import win32com.client
-                
                 desktop = os.path.join(os.path.expanduser("~"), "Desktop")
                 shortcut_name = os.path.splitext(os.path.basename(file_path))[0] + ".lnk"
                 shortcut_path = os.path.join(desktop, shortcut_name)
                 
-                shell = win32com.client.Dispatch("WScript.Shell")
+                shell = self._get_wscript_shell()
                 shortcut = shell.CreateShortCut(shortcut_path)
                 shortcut.Targetpath = file_path
                 shortcut.WorkingDirectory = os.path.dirname(file_path)
@@ -2993,10 +3508,25 @@ class FileSearchApp:
         self.root.clipboard_append(file_path)
         self.update_status(self.t("copied_path"))
     
+    def get_file_item(self, file_path: str) -> FileItem:
+        """Get FileItem for path, reusing a recent stat result if available"""
+        now = time.monotonic()
+        cached = self._file_item_cache.get(file_path)
+        if cached and now - cached[0] < FILE_ITEM_CACHE_TTL:
+            self._file_item_cache.move_to_end(file_path)
+            return cached[1]
+        
+        file_item = FileItem(file_path)
+        self._file_item_cache[file_path] = (now, file_item)
+        self._file_item_cache.move_to_end(file_path)
+        if len(self._file_item_cache) > FILE_ITEM_CACHE_SIZE:
+            self._file_item_cache.popitem(last=False)
+        return file_item
+    
     def show_properties(self, file_path: str):
         """Show file properties"""
         try:
-            file_item = FileItem(file_path)
+            file_item = self.get_file_item(file_path)
             
             props_window = tk.Toplevel(self.root)
             props_window.title(self.t("file_properties"))
@@ -3031,13 +3561,9 @@ class FileSearchApp:
             return
         
         try:
-            # Create dialog with icon
-            dialog = tk.Toplevel(self.root)
-            dialog.withdraw()
-            self.set_window_icon(dialog)
-            dialog.destroy()
-            
+            # Dialog inherits the icon from the root window
             destination = filedialog.askdirectory(
+                parent=self.root,
                 title=self.t("select_destination"),
                 initialdir=os.path.dirname(file_paths[0])
             )
@@ -3047,22 +3573,20 @@ class FileSearchApp:
                 skip_count = 0
                 error_count = 0
                 
+                # Check all destinations up front and ask once for every collision
+                collisions = self.find_collisions(file_paths, destination)
+                overwrite = self.ask_overwrite_policy(collisions)
+                if overwrite is None:  # Cancel
+                    return
+                
                 for file_path in file_paths:
                     try:
                         filename = os.path.basename(file_path)
                         dest_path = os.path.join(destination, filename)
                         
-                        # Check if file exists
-                        if os.path.exists(dest_path):
-                            result = messagebox.askyesnocancel(
-                                self.t("file_exists"), 
-                                f"{filename}\n\n{self.t('overwrite_confirm')}"
-                            )
-                            if result is None:  # Cancel
-                                break
-                            elif not result:  # No
-                                skip_count += 1
-                                continue
+                        if file_path in collisions and not overwrite:
+                            skip_count += 1
+                            continue
                         
                         shutil.copy2(file_path, dest_path)
                         success_count += 1
@@ -3086,18 +3610,49 @@ class FileSearchApp:
         except Exception as e:
             messagebox.showerror(self.t("error"), f"Copy failed:\n{str(e)}")
     
+    def find_collisions(self, file_paths: list, destination: str) -> set:
+        """Return source paths whose file name already exists in destination or earlier in the batch"""
+        # One directory read instead of a stat per file
+        try:
+            with os.scandir(destination) as entries:
+                existing = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            existing = set()  # Unreadable destination: still catch duplicates within the batch
+        
+        collisions = set()
+        for file_path in file_paths:
+            name = os.path.normcase(os.path.basename(file_path))
+            if name in existing:
+                collisions.add(file_path)
+            # Earlier files in the batch are written first, so later ones with the same name collide
+            existing.add(name)
+        return collisions
+    
+    def ask_overwrite_policy(self, collisions: set):
+        """Ask once how to handle existing files.
+        Returns True to overwrite all, False to skip all, None to cancel
+        """
+        if not collisions:
+            return True
+        
+        names = sorted(os.path.basename(p) for p in collisions)
+        preview = "\n".join(names[:10])
+        if len(names) > 10:
+            preview += "\n..."
+        
+        return messagebox.askyesnocancel(
+            self.t("file_exists"),
+            f"{self.t('overwrite_all_confirm').format(len(names))}\n\n{preview}"
+        )
+    
     def move_files_to(self, file_paths: list):
         """Move multiple files to selected directory"""
         if not file_paths:
             return
         
         try:
-            dialog = tk.Toplevel(self.root)
-            dialog.withdraw()
-            self.set_window_icon(dialog)
-            dialog.destroy()
-            
             destination = filedialog.askdirectory(
+                parent=self.root,
                 title=self.t("select_destination"),
                 initialdir=os.path.dirname(file_paths[0])
             )
@@ -3107,23 +3662,23 @@ class FileSearchApp:
                 skip_count = 0
                 error_count = 0
                 
+                collisions = self.find_collisions(file_paths, destination)
+                overwrite = self.ask_overwrite_policy(collisions)
+                if overwrite is None:
+                    return
+                
                 for file_path in file_paths:
                     try:
                         filename = os.path.basename(file_path)
                         dest_path = os.path.join(destination, filename)
                         
-                        if os.path.exists(dest_path):
-                            result = messagebox.askyesnocancel(
-                                self.t("file_exists"), 
-                                f"{filename}\n\n{self.t('overwrite_confirm')}"
-                            )
-                            if result is None:
-                                break
-                            elif not result:
-                                skip_count += 1
-                                continue
+                        if file_path in collisions and not overwrite:
+                            skip_count += 1
+                            continue
                         
                         shutil.move(file_path, dest_path)
+                        self._file_item_cache.pop(file_path, None)
+                        self._file_item_cache.pop(dest_path, None)
                         success_count += 1
                         self.update_status(f"Moving {success_count}/{len(file_paths)}: {filename}")
                         
@@ -3154,34 +3709,48 @@ class FileSearchApp:
             return
         
         try:
-            import win32com.client
+            # Single COM object for the whole batch
+            shell = self._get_wscript_shell()
             
-            startup_folder = os.path.join(
-                os.environ['APPDATA'],
-                r'Microsoft\Windows\Start Menu\Programs\Startup'
-            )
+            startup_folder = self.get_startup_folder()
             
             success_count = 0
             skip_count = 0
             error_count = 0
             
+            # Existing shortcut names from a single directory read
+            try:
+                with os.scandir(startup_folder) as entries:
+                    existing = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                existing = set()
+            
+            # Resolve prompts first so the shortcuts are written in one pass
+            shortcuts_to_create = []
+            exists_title = self.t("already_exists")
+            replace_text = self.t('replace_startup_shortcut')
             for file_path in file_paths:
+                filename = os.path.splitext(os.path.basename(file_path))[0]
+                shortcut_path = os.path.join(startup_folder, f"{filename}.lnk")
+                shortcut_name = os.path.normcase(f"{filename}.lnk")
+                
+                if shortcut_name in existing:
+                    result = messagebox.askyesnocancel(
+                        exists_title,
+                        f"{filename}\n\n{replace_text}"
+                    )
+                    if result is None:
+                        break
+                    elif not result:
+                        skip_count += 1
+                        continue
+                
+                shortcuts_to_create.append((file_path, filename, shortcut_path))
+                existing.add(shortcut_name)  # e.g. foo.exe and foo.bat both write foo.lnk
+            
+            # WScript.Shell lives in this thread's COM apartment, so writes stay serial
+            for file_path, filename, shortcut_path in shortcuts_to_create:
                 try:
-                    filename = os.path.splitext(os.path.basename(file_path))[0]
-                    shortcut_path = os.path.join(startup_folder, f"{filename}.lnk")
-                    
-                    if os.path.exists(shortcut_path):
-                        result = messagebox.askyesnocancel(
-                            self.t("already_exists"),
-                            f"{filename}\n\n{self.t('replace_startup_shortcut')}"
-                        )
-                        if result is None:
-                            break
-                        elif not result:
-                            skip_count += 1
-                            continue
-                    
-                    shell = win32com.client.Dispatch("WScript.Shell")
                     shortcut = shell.CreateShortCut(shortcut_path)
                     shortcut.TargetPath = file_path
                     shortcut.WorkingDirectory = os.path.dirname(file_path)
@@ -3189,7 +3758,7 @@ class FileSearchApp:
                     shortcut.save()
                     
                     success_count += 1
-                    self.update_status(f"Adding to startup {success_count}/{len(file_paths)}: {filename}")
+                    self.update_status(f"Adding to startup {success_count}/{len(shortcuts_to_create)}: {filename}")
                     
                 except Exception as e:
                     error_count += 1
@@ -3219,10 +3788,7 @@ class FileSearchApp:
             return
         
         try:
-            startup_folder = os.path.join(
-                os.environ['APPDATA'],
-                r'Microsoft\Windows\Start Menu\Programs\Startup'
-            )
+            startup_folder = self.get_startup_folder()
             os.startfile(startup_folder)
             self.update_status(self.t("opened_startup_folder"))
         except Exception as e:
@@ -3230,11 +3796,7 @@ class FileSearchApp:
     
     def execute_selected(self):
         """Execute all selected files"""
-        checked_files = [
-            self.tree.item(item_id, "values")[3]
-            for item_id, checked in self.checked_items.items()
-            if checked
-        ]
+        checked_files = self.get_checked_paths()
         
         if not checked_files:
             messagebox.showinfo(self.t("no_selection"), self.t("select_files_msg"))
@@ -3243,41 +3805,62 @@ class FileSearchApp:
         if not messagebox.askyesno(self.t("confirm_execution"), self.t("execute_confirm").format(len(checked_files))):
             return
         
-        thread = threading.Thread(target=self.execute_files_sequentially, args=(checked_files,), daemon=True)
+        thread = threading.Thread(target=self.execute_files_concurrently, args=(checked_files,), daemon=True)
         thread.start()
     
-    def execute_files_sequentially(self, file_paths: List[str]):
-        """Execute files sequentially"""
-        for i, file_path in enumerate(file_paths, 1):
+    def get_checked_paths(self) -> List[str]:
+        """Paths of all checked rows, without querying the tree"""
+        return [
+            self._item_paths[item_id]
+            for item_id, checked in self.checked_items.items()
+            if checked
+        ]
+    
+    def execute_files_concurrently(self, file_paths: List[str]):
+        """Execute files with a small bounded number of concurrent launches"""
+        total = len(file_paths)
+        executing_text = self.t("executing")
+        
+        def launch(index, file_path):
             try:
-                self.root.after(0, self.update_status, self.t("executing").format(i, len(file_paths), os.path.basename(file_path)))
+                self.update_status(executing_text.format(index, total, os.path.basename(file_path)))
                 
                 if sys.platform == 'win32':
-                    os.startfile(file_path)
+                    ret = ctypes.windll.shell32.ShellExecuteW(None, "open", file_path, None, None, 1)
+                    if ret <= 32:
+                        # Fall back to os.startfile, which raises a descriptive error
+                        os.startfile(file_path)
                 else:
                     subprocess.Popen(['xdg-open', file_path])
                 
-                import time
-                time.sleep(0.5)
-                
             except Exception as e:
                 self.root.after(0, messagebox.showerror, self.t("execution_error"), f"Failed to execute {file_path}:\n{str(e)}")
         
-        self.root.after(0, self.update_status, self.t("completed_executing").format(len(file_paths)))
+        # Limit concurrent launches so the shell is not flooded
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LAUNCHES) as executor:
+            for index, file_path in enumerate(file_paths, 1):
+                executor.submit(launch, index, file_path)
+        
+        self.update_status(self.t("completed_executing").format(total))
     
     def clear_results(self):
         """Clear search results"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        with self._pending_lock:
+            self._pending_batches = []  # Never flush rows from an earlier search
+        self.tree.delete(*self.tree.get_children())
+        self._results_count = 0
+        self._item_index = {}
         self.search_results.clear()
         self.checked_items.clear()
+        self._item_paths.clear()
+        self._sort_keys.clear()
+        self._hover_band = None
         self.results_label.config(text=self.t("results") + " 0")
         self.update_status(self.t("results_cleared"))
     
     def update_results_label(self):
         """Update results count label"""
-        count = len(self.tree.get_children())
-        self.results_label.config(text=self.t("results") + f" {count}")
+        self.results_label.config(text=self.t("results") + f" {self._results_count}")
     
     def export_results(self):
         """Export search results to CSV"""
@@ -3296,19 +3879,22 @@ class FileSearchApp:
         
         try:
             import csv
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
                 writer = csv.writer(f)
                 writer.writerow([self.t("name").rstrip(':'), self.t("type"), self.t("modified_date"), 
                                self.t("size"), self.t("full_path")])
                 
-                for file_item in self.search_results:
-                    writer.writerow([
+                # Let the C writer drive the loop over all rows
+                writer.writerows(
+                    (
                         file_item.name,
                         file_item.get_type(),
                         file_item.modified.strftime("%Y-%m-%d %H:%M:%S"),
                         file_item.get_size_str(),
                         file_item.path
-                    ])
+                    )
+                    for file_item in self.search_results
+                )
             
             messagebox.showinfo(self.t("export_complete"), self.t("exported_to").format(file_path))
             self.update_status(f"Exported {len(self.search_results)} results to CSV")
@@ -3317,8 +3903,24 @@ class FileSearchApp:
             messagebox.showerror(self.t("export_error"), f"Failed to export results:\n{str(e)}")
     
     def update_status(self, message: str):
-        """Update status bar"""
-        self.status_label.config(text=message)
+        """Update status bar (safe to call from any thread)"""
+        if threading.current_thread() is threading.main_thread():
+            with self._status_lock:
+                self._status_slot = None  # Drop any older message from a worker
+            self.status_label.config(text=message)
+        else:
+            # Latest message wins; drain_status applies it on the Tk thread
+            with self._status_lock:
+                self._status_slot = message
+    
+    def drain_status(self):
+        """Apply the latest status posted by worker threads"""
+        with self._status_lock:
+            message = self._status_slot
+            self._status_slot = None
+        if message is not None:
+            self.status_label.config(text=message)
+        self.root.after(100, self.drain_status)
     
     def change_language(self, lang_code: str, lang_display: str = None):
         """Change application language and update UI immediately"""
@@ -3331,8 +3933,8 @@ class FileSearchApp:
         self.current_language = lang_display
         self.current_language_code = lang_code
         
-        # Reset to default translations first
-        self.translations = self.DEFAULT_TRANSLATIONS.copy()
+        # Reset to default translations first (shared, not copied, for English)
+        self.translations = self.DEFAULT_TRANSLATIONS
         
         # Try to load language file
         success = False
@@ -3340,6 +3942,7 @@ class FileSearchApp:
         lang_path = resource_path(os.path.join("language", lang_file))
         
         if lang_code != "en":
+            self.translations = self.DEFAULT_TRANSLATIONS.copy()
             success = self.load_language_file_by_code(lang_code)
         else:
             success = True  # English is default
@@ -3375,7 +3978,9 @@ class FileSearchApp:
             # Revert to old language
             self.current_language = old_language
             self.current_language_code = old_language_code
+            self.translations = self.DEFAULT_TRANSLATIONS
             if old_language_code != "en":
+                self.translations = self.DEFAULT_TRANSLATIONS.copy()
                 self.load_language_file_by_code(old_language_code)
             
             # Show detailed error with paths
@@ -3391,6 +3996,8 @@ class FileSearchApp:
             )
             
             messagebox.showerror("Language Error", error_msg)
+        
+        self.build_context_menu_labels()
     
     def update_ui_text(self):
         """Update all UI text with current language"""
@@ -3398,9 +4005,7 @@ class FileSearchApp:
         self.root.title(self.t("title"))
         
         # Update menu
-        self.menu_bar.entryconfig(0, label=self.t("menu_view"))
-        self.menu_bar.entryconfig(1, label=self.t("menu_language"))
-        self.menu_bar.entryconfig(2, label=self.t("menu_help"))
+        self.retranslate_menus()
         
         # Update buttons (need to recreate main UI elements)
         # For simplicity, show message that some elements need restart
@@ -3416,22 +4021,41 @@ class FileSearchApp:
         self.update_status(self.t("opening_github"))
     
     def show_about(self):
-        """Show about dialog"""
-        about_window = tk.Toplevel(self.root)
-        about_window.title(self.t("about_title"))
-        about_window.geometry("400x250")
-        about_window.resizable(False, False)
-        self.set_window_icon(about_window)
-        
-        about_frame = ttk.Frame(about_window, padding="20")
-        about_frame.pack(fill=tk.BOTH, expand=True)
-        
-        ttk.Label(about_frame, text=self.t("title"), font=('', 16, 'bold')).pack(pady=(0, 10))
-        ttk.Label(about_frame, text=self.t("description"), justify=tk.CENTER).pack(pady=(0, 10))
-        ttk.Label(about_frame, text=self.t("created_by") + "gloriouslegacy").pack(pady=(0, 5))
-        ttk.Label(about_frame, text=self.t("copyright")).pack(pady=(0, 20))
+        """Show about dialog (built once, hidden when closed)"""
+        about_window = self._about_window
+        if about_window is None or not about_window.winfo_exists():
+            about_window = tk.Toplevel(self.root)
+            about_window.geometry("400x250")
+            about_window.resizable(False, False)
+            self.set_window_icon(about_window)
+            about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
+            
+            about_frame = ttk.Frame(about_window, padding="20")
+            about_frame.pack(fill=tk.BOTH, expand=True)
+            
+            self._about_labels = [
+                ttk.Label(about_frame, font=('', 16, 'bold')),
+                ttk.Label(about_frame, justify=tk.CENTER),
+                ttk.Label(about_frame),
+                ttk.Label(about_frame),
+            ]
+            for label, pady in zip(self._about_labels, [(0, 10), (0, 10), (0, 5), (0, 20)]):
+                label.pack(pady=pady)
+            
+            self._about_close_btn = ttk.Button(about_frame, command=about_window.withdraw)
+            self._about_close_btn.pack()
+            self._about_window = about_window
         
-        ttk.Button(about_frame, text=self.t("close"), command=about_window.destroy).pack()
+        # Refresh texts in case the language changed since the last open
+        about_window.title(self.t("about_title"))
+        texts = [self.t("title"), self.t("description"),
+                 self.t("created_by") + "gloriouslegacy", self.t("copyright")]
+        for label, text in zip(self._about_labels, texts):
+            label.config(text=text)
+        self._about_close_btn.config(text=self.t("close"))
+        
+        about_window.deiconify()
+        about_window.lift()
     
     def check_for_updates(self):
         """Check for updates from GitHub"""
@@ -3440,10 +4064,7 @@ class FileSearchApp:
                 self.update_status(self.t("checking_update"))
                 
                 # Get latest release info from GitHub
-                req = urllib.request.Request(GITHUB_API_URL)
-                req.add_header('User-Agent', 'ezSLauncher')
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
+                with URL_OPENER.open(GITHUB_API_URL, timeout=10) as response:
                     data = json.loads(response.read().decode())
                 
                 latest_version = data['tag_name'].lstrip('v')
@@ -3480,10 +4101,7 @@ class FileSearchApp:
         def check_thread():
             try:
                 # Get latest release info from GitHub
-                req = urllib.request.Request(GITHUB_API_URL)
-                req.add_header('User-Agent', 'ezSLauncher')
-                
-                with urllib.request.urlopen(req, timeout=10) as response:
+                with URL_OPENER.open(GITHUB_API_URL, timeout=10) as response:
                     data = json.loads(response.read().decode())
                 
                 latest_version = data['tag_name'].lstrip('v')
@@ -3501,19 +4119,20 @@ class FileSearchApp:
         threading.Thread(target=check_thread, daemon=True).start()
     
     def compare_versions(self, v1: str, v2: str) -> int:
-        """Compare two version strings using string comparison.
-        This ensures v0.2.9 > v0.2.89 and v0.2.8 > v0.2.71 as requested.
+        """Compare two version strings.
+        The major number is compared numerically; the remaining parts are
+        compared digit-wise, which keeps v0.2.9 > v0.2.89 and v0.2.8 > v0.2.71 as requested.
         Returns: 1 if v1 > v2, 0 if equal, -1 if v1 < v2
         """
-        # Normalize strings (remove v, whitespace)
-        s1 = v1.lower().lstrip('v').strip()
-        s2 = v2.lower().lstrip('v').strip()
-        
-        if s1 > s2:
-            return 1
-        elif s1 < s2:
-            return -1
-        return 0
+        def version_key(version):
+            parts = re.findall(r'\d+', version)
+            if not parts:
+                return ()
+            return (int(parts[0]), *parts[1:])
+        
+        a = version_key(v1)
+        b = version_key(v2)
+        return (a > b) - (a < b)
     
     def show_update_dialog(self, release_data, latest_version):
         """Show update available dialog"""
@@ -3569,10 +4188,10 @@ class FileSearchApp:
                 # Different SHA256 patterns for different file types
                 if is_portable:
                     # Look for Portable Version SHA256
-                    sha_match = re.search(r'\*\*Portable Version.*?```\s*([a-fA-F0-9]{64})\s*```', body, re.DOTALL)
+                    sha_match = SHA_PORTABLE_PATTERN.search(body)
                 else:
                     # Look for Installer Version SHA256
-                    sha_match = re.search(r'\*\*Installer Version.*?```\s*([a-fA-F0-9]{64})\s*```', body, re.DOTALL)
+                    sha_match = SHA_INSTALLER_PATTERN.search(body)
                 
                 if sha_match:
                     sha256_sum = sha_match.group(1).strip().lower()
@@ -3581,14 +4200,31 @@ class FileSearchApp:
                 self.update_status(self.t("downloading_update"))
                 download_path = os.path.join(CONFIG_DIR, asset_name)
                 
-                def reporthook(block_num, block_size, total_size):
-                    if total_size > 0:
-                        percent = min(100, int(block_num * block_size * 100 / total_size))
-                        self.root.after(0, lambda: self.update_status(
-                            self.t("download_progress").format(percent)
-                        ))
-                
-                urllib.request.urlretrieve(download_url, download_path, reporthook=reporthook)
+                # Stream in 1 MB chunks; report whole-percent progress at most 5 times per second
+                with URL_OPENER.open(download_url, timeout=30) as response, \
+                        open(download_path, 'wb', buffering=1024 * 1024) as out:
+                    total_size = int(response.headers.get('Content-Length') or 0)
+                    buffer = memoryview(bytearray(1024 * 1024))
+                    downloaded = 0
+                    last_report = 0.0
+                    last_percent = -1
+                    progress_text = self.t("download_progress")
+                    while True:
+                        n = response.readinto(buffer)
+                        if not n:
+                            break
+                        out.write(buffer[:n])
+                        downloaded += n
+                        
+                        if total_size > 0:
+                            # Only report whole-percent changes
+                            percent = min(100, downloaded * 100 // total_size)
+                            if percent != last_percent:
+                                now = time.monotonic()
+                                if now - last_report >= 0.2 or percent == 100:
+                                    last_report = now
+                                    last_percent = percent
+                                    self.update_status(progress_text.format(percent))
                 
                 # Verify checksum if available
                 if sha256_sum:
@@ -3619,11 +4255,19 @@ class FileSearchApp:
     
     def calculate_sha256(self, filepath):
         """Calculate SHA256 hash of file"""
-        sha256_hash = hashlib.sha256()
         with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashing loop runs in C
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            
+            sha256_hash = hashlib.sha256()
+            buffer = memoryview(bytearray(1024 * 1024))
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                sha256_hash.update(buffer[:n])
+            return sha256_hash.hexdigest()
     
     def create_backup(self):
         """Create backup of current executable and config"""
@@ -3636,7 +4280,12 @@ class FileSearchApp:
                 exe_path = sys.executable
                 exe_name = os.path.basename(exe_path)
                 backup_exe = os.path.join(backup_dir, exe_name)
-                shutil.copy2(exe_path, backup_exe)
+                if sys.platform == 'win32':
+                    # Kernel-side copy; also keeps timestamps and attributes like copy2
+                    if not ctypes.windll.kernel32.CopyFileExW(exe_path, backup_exe, None, None, None, 0):
+                        raise ctypes.WinError()
+                else:
+                    shutil.copy2(exe_path, backup_exe)
             
             # Config is already in CONFIG_DIR, no need to backup
             
@@ -3662,11 +4311,13 @@ class FileSearchApp:
                     try:
                         with zipfile.ZipFile(update_path, 'r') as zip_ref:
                             # Check if updater.exe is in the zip
-                            if 'updater.exe' in zip_ref.namelist():
-                                zip_ref.extract('updater.exe', exe_dir)
-                                updater_path = os.path.join(exe_dir, "updater.exe")
-                            else:
+                            try:
+                                info = zip_ref.getinfo('updater.exe')
+                            except KeyError:
                                 raise Exception("updater.exe not found in update package")
+                            
+                            with zip_ref.open(info) as src, open(updater_path, 'wb', buffering=1024 * 1024) as dst:
+                                shutil.copyfileobj(src, dst, 1024 * 1024)
                     except Exception as e:
                         raise Exception(f"updater.exe not found. Please download the complete package.\nError: {str(e)}")
                 
@@ -3741,27 +4392,51 @@ del "%~f0"
         """Schedule save settings with debounce (wait 500ms after last change)"""
         if self.save_timer:
             self.root.after_cancel(self.save_timer)
-        self.save_timer = self.root.after(500, self.save_settings)
+        self.save_timer = self.root.after(500, self._flush_save_settings)
+    
+    def _flush_save_settings(self):
+        """Debounce timer fired: save once for the whole burst of edits"""
+        self.save_timer = None
+        self.save_settings()
     
     def save_settings(self):
         """Save settings to config file"""
-        self.config = {
-            "name_filter": self.name_filter.get(),
-            "ext_filter": self.ext_filter.get(),
-            "path_filter": self.path_filter.get(),
-            "exclude_path_filter": self.exclude_path_filter.get(),
-            "search_dir": self.search_dir.get(),
-            "recursive": self.recursive_var.get(),
-            "use_regex": self.regex_var.get(),
-            "dark_mode": self.dark_mode,
-            "language": self.current_language,
-            "use_index": self.use_index_var.get()
-        }
+        if self.save_timer:
+            # An immediate save covers any pending debounced one
+            self.root.after_cancel(self.save_timer)
+            self.save_timer = None
+        
+        snapshot = (
+            self.name_filter.get(),
+            self.ext_filter.get(),
+            self.path_filter.get(),
+            self.exclude_path_filter.get(),
+            self.search_dir.get(),
+            self.recursive_var.get(),
+            self.regex_var.get(),
+            self.dark_mode,
+            self.current_language,
+            self.use_index_var.get()
+        )
+        if snapshot == self._saved_config_snapshot:
+            return  # Same values as the last save; skip serialization
+        
+        self.config = dict(zip(CONFIG_KEYS, snapshot))
+        
+        payload = json.dumps(self.config, indent=4).encode('utf-8')
+        if payload == self._saved_config_payload:
+            self._saved_config_snapshot = snapshot
+            return  # Nothing changed since the last write
         
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
-            print(f"Settings saved: use_index={self.use_index_var.get()}")  # Debug output
+            # Write to a temp file and swap it in so a crash never leaves a truncated config
+            tmp_file = CONFIG_FILE + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, CONFIG_FILE)
+            self._saved_config_payload = payload
+            self._saved_config_snapshot = snapshot
+            print(f"Settings saved: use_index={self.config['use_index']}")  # Debug output
         except Exception as e:
             print(f"Failed to save config: {e}")
     
@@ -3823,7 +4498,6 @@ class IdleMonitor:
     def get_idle_time(self):
         """Get system idle time in seconds"""
         if sys.platform == 'win32':
-            import ctypes
             class LASTINPUTINFO(ctypes.Structure):
                 _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
             
@@ -3857,7 +4531,7 @@ class IdleMonitor:
     def start_indexing(self):
         self.is_indexing = True
         self.stop_event.clear()
-        self.app.root.after(0, self.app.update_status, self.app.t("idle_indexing_started"))
+        self.app.update_status(self.app.t("idle_indexing_started"))
         
         def run_update():
             try:
@@ -3872,13 +4546,13 @@ class IdleMonitor:
                 self.app.indexer.update_index(progress_callback=progress)
                 
                 if not self.stop_event.is_set():
-                    self.app.root.after(0, self.app.update_status, self.app.t("index_complete"))
+                    self.app.update_status(self.app.t("index_complete"))
             except:
                 pass
             finally:
                 self.is_indexing = False
                 if self.stop_event.is_set():
-                    self.app.root.after(0, self.app.update_status, self.app.t("idle_indexing_stopped"))
+                    self.app.update_status(self.app.t("idle_indexing_stopped"))
         
         threading.Thread(target=run_update, daemon=True).start()
         